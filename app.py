@@ -1,14 +1,21 @@
 import os
 import sys
 import streamlit as st
-import pandas as pd
 
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from utils import load_data_from_data_base, generate_model_dict, split_forecasts_by_model, create_line_plot,create_bar_chart,combine_backtest_forecast
+from config import APP_DEBUG
+from data_store import series_store
+from timing import span, start_run
+from metrics import align_forecasts_with_actuals, compute_accuracy_metrics
+from utils import MODEL_OPTIONS, generate_model_dict, split_forecasts_by_model, create_line_plot,create_bar_chart,combine_original_normalized_forecasts, rolling_origin_backtest, summarize_backtest_errors
 
 
+# Spans recorded during this rerun are collected for the debug timing panel
+timing_run = start_run()
+debug_mode = APP_DEBUG or st.query_params.get("debug") == "1"
+
 st.markdown(
     """
     <style>
@@ -35,99 +42,134 @@ variable_descriptions = {
 }
 
 
-@st.cache_data
-def get_data():
-    st.write("Connecting to the database...")
-    df = load_data_from_data_base()
-    return df
+# Series are held once per process and shared by every session through reference-counted views
+def get_data(variable):
+    if series_store.watermark(variable) is None:
+        st.write("Connecting to the database...")
+    with span("get_data", variable=variable):
+        return series_store.view(variable)
 
 if "data_loaded" not in st.session_state:
     st.session_state.data_loaded = False
 
 if st.button("Load Data from Database") or st.session_state.data_loaded:
-    if not st.session_state.data_loaded:
-        st.session_state.data = get_data()
-        st.session_state.data_loaded = True
-
-    data = st.session_state.data
-    st.write("Data Loaded:")
-    st.dataframe(data)
+    st.session_state.data_loaded = True
 
     dropdown_options = [f"{key} - {value}" for key, value in variable_descriptions.items()]
     selected_option = st.selectbox("Select a variable for forecasting:", dropdown_options)
     variable = selected_option.split(" - ")[0]
-    fcast_horizon = st.slider("Select forecasting horizon (months):", 1, 90, 12)
-    model_options = ["xgboost", "arima", "random_forest"]
-    selected_models = st.multiselect("Select forecasting models for comparison:", model_options, default=["xgboost"])
-
-    if st.button("Generate Forecast"):
-        if not selected_models:
-            st.error("Please select at least one forecasting model before proceeding.")
-        else:
-            with st.spinner("calculating forecasts, please wait..."):
-                # Filter data for the selected variable
-                filtered_data = data[data['variable'] == variable]
-                filtered_data['date'] = pd.to_datetime(filtered_data['date'])
-
-                backtest_data = filtered_data.iloc[:-fcast_horizon]
-
-                model_dict = generate_model_dict(selected_models)
-
-                # Combine backtest and forecast for original values
-                forecast_original_df = combine_backtest_forecast(
-                    filtered_data, backtest_data, fcast_horizon, "value", selected_models
-                )
-
-                # Combine backtest and forecast for normalized values
-                forecast_normalized_df = combine_backtest_forecast(
-                    filtered_data, backtest_data, fcast_horizon, "value01", selected_models
-                )
-
-                min_value, max_value = filtered_data['value'].min(), filtered_data['value'].max()
-                forecast_normalized_df['value'] = (
-                                                          forecast_normalized_df['value01'] * (max_value - min_value)
-                                                  ) + min_value
-
-                forecasts_original = split_forecasts_by_model(forecast_original_df, model_dict)
-                forecasts_normalized = split_forecasts_by_model(forecast_normalized_df, model_dict)
-
-                zoom_range = [filtered_data['date'].iloc[-20], forecast_original_df['date'].iloc[-1]]
-
-                # Create line plots
-                fig_original = create_line_plot(
-                    filtered_data, forecasts_original,
-                    f"Original Values Forecast Comparison with Backtest for {variable}",
-                    "Value", zoom_range
-                )
-                fig_normalized = create_line_plot(
-                    filtered_data, forecasts_normalized,
-                    f"Normalized Values Forecast Comparison with Backtest for {variable}",
-                    "Value", zoom_range
-                )
-
-                # Create bar charts
-                bar_chart_original = create_bar_chart(
-                    filtered_data, forecasts_original,
-                    f"Original Values Bar Chart for {variable}",
-                    "Value", zoom_range
-                )
-                bar_chart_normalized = create_bar_chart(
-                    filtered_data, forecasts_normalized,
-                    f"Normalized Values Bar Chart for {variable}",
-                    "Value", zoom_range
-                )
-
-                # Display line charts
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.plotly_chart(fig_original)
-                with col2:
-                    st.plotly_chart(fig_normalized)
-
-                # Display bar charts
-                st.write("Bar Charts:")
-                bar_col1, bar_col2 = st.columns(2)
-                with bar_col1:
-                    st.plotly_chart(bar_chart_original, use_container_width=True)
-                with bar_col2:
-                    st.plotly_chart(bar_chart_normalized, use_container_width=True)
\ No newline at end of file
+
+    # Only the selected series is fetched from the database
+    if st.button("Refresh Data"):
+        new_rows = series_store.refresh(variable)
+        st.write(f"{new_rows} new rows loaded for {variable}.")
+    with get_data(variable) as data:
+        st.write("Data Loaded:")
+        st.dataframe(data)
+
+        fcast_horizon = st.slider("Select forecasting horizon (months):", 1, 90, 12)
+        model_options = MODEL_OPTIONS
+        selected_models = st.multiselect("Select forecasting models for comparison:", model_options, default=model_options[:1])
+        strict_normalized = st.checkbox(
+            "Request normalized forecasts from the API (for models that are not scale-invariant)", value=False
+        )
+        n_folds = st.slider("Select number of rolling-origin backtest folds:", 1, 12, 1)
+
+        if st.button("Generate Forecast"):
+            if not selected_models:
+                st.error("Please select at least one forecasting model before proceeding.")
+            else:
+                with st.spinner("calculating forecasts, please wait..."):
+                    with span("filter", variable=variable):
+                        # Dates are already parsed by the loader
+                        filtered_data = data
+
+                        backtest_data = filtered_data.iloc[:-fcast_horizon]
+
+                    model_dict = generate_model_dict(selected_models)
+
+                    # Combine backtest and forecast for original and normalized values
+                    try:
+                        forecast_original_df, forecast_normalized_df = combine_original_normalized_forecasts(
+                            filtered_data, backtest_data, fcast_horizon, selected_models, strict=strict_normalized
+                        )
+                    except Exception as error:
+                        # No st.stop() here, so the rerun still reaches the timing breakdown below
+                        st.error(f"The forecasting service is unavailable, please try again later. ({error})")
+                    else:
+                        if forecast_original_df.attrs.get("stale") or forecast_normalized_df.attrs.get("stale"):
+                            st.warning("The forecasting service is unavailable; showing the last available forecasts.")
+
+                        min_value, max_value = filtered_data['value'].min(), filtered_data['value'].max()
+                        forecast_normalized_df['value'] = (
+                                                                  forecast_normalized_df['value01'] * (max_value - min_value)
+                                                          ) + min_value
+
+                        forecasts_original = split_forecasts_by_model(forecast_original_df, model_dict)
+                        forecasts_normalized = split_forecasts_by_model(forecast_normalized_df, model_dict)
+
+                        zoom_range = [filtered_data['date'].iloc[-20], forecast_original_df['date'].iloc[-1]]
+
+                        # Create line plots
+                        fig_original = create_line_plot(
+                            filtered_data, forecasts_original,
+                            f"Original Values Forecast Comparison with Backtest for {variable}",
+                            "Value", zoom_range
+                        )
+                        fig_normalized = create_line_plot(
+                            filtered_data, forecasts_normalized,
+                            f"Normalized Values Forecast Comparison with Backtest for {variable}",
+                            "Value", zoom_range
+                        )
+
+                        # Create bar charts
+                        bar_chart_original = create_bar_chart(
+                            filtered_data, forecasts_original,
+                            f"Original Values Bar Chart for {variable}",
+                            "Value", zoom_range
+                        )
+                        bar_chart_normalized = create_bar_chart(
+                            filtered_data, forecasts_normalized,
+                            f"Normalized Values Bar Chart for {variable}",
+                            "Value", zoom_range
+                        )
+
+                        # Compare backtest accuracy of every model (the table is sortable by column)
+                        st.write("Backtest accuracy:")
+                        st.dataframe(
+                            compute_accuracy_metrics(align_forecasts_with_actuals(forecasts_original, filtered_data)),
+                            hide_index=True
+                        )
+
+                        # Evaluate models over several forecast origins
+                        if n_folds > 1:
+                            try:
+                                rolling_backtests = rolling_origin_backtest(
+                                    filtered_data, fcast_horizon, "value", selected_models, n_folds=n_folds
+                                )
+                            except Exception as error:
+                                st.error(f"The rolling-origin backtest could not be computed. ({error})")
+                            else:
+                                st.write(f"Backtest errors across {n_folds} folds:")
+                                st.dataframe(summarize_backtest_errors(rolling_backtests, "value", model_dict), hide_index=True)
+
+                        # Display line charts
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.plotly_chart(fig_original)
+                        with col2:
+                            st.plotly_chart(fig_normalized)
+
+                        # Display bar charts
+                        st.write("Bar Charts:")
+                        bar_col1, bar_col2 = st.columns(2)
+                        with bar_col1:
+                            st.plotly_chart(bar_chart_original, use_container_width=True)
+                        with bar_col2:
+                            st.plotly_chart(bar_chart_normalized, use_container_width=True)
+
+# Per-rerun timing breakdown, shown with APP_DEBUG=1 or the `?debug=1` query parameter
+timing_run.finish()
+if debug_mode:
+    with st.expander(f"Timings: {timing_run.duration_ms:.0f} ms for this rerun"):
+        st.dataframe(timing_run.summary(), hide_index=True)
@@ -0,0 +1,177 @@
+import gzip
+import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ForecastingClient:
+    """
+    Synchronous client for the Thaink² forecasting endpoint with a pooled keep-alive session.
+
+    It mirrors the request of `ForecastingAPI.th2forecast_api` (endpoint, bearer token and
+    records-oriented ISO-dated actuals), but every call goes through one `requests.Session`
+    with up to `pool_maxsize` kept-alive connections and is bounded by `timeout`.
+
+    `wire_format` selects the request encoding: "json" sends the body exactly like
+    the th2analytics client, "json-gzip" sends it compactly serialized and gzip
+    compressed (the backend or its proxy must accept `Content-Encoding: gzip`).
+    Responses are always requested with gzip/deflate transfer compression.
+    """
+
+    endpoint = "thaink2/forecasting"
+    wire_formats = ("json", "json-gzip")
+
+    def __init__(self, base_url, api_token, timeout=120, wire_format="json", pool_maxsize=1):
+        if wire_format not in self.wire_formats:
+            raise ValueError(f"Unknown wire format: {wire_format}")
+        self.base_url = base_url
+        self.api_token = api_token
+        self.timeout = timeout
+        self.wire_format = wire_format
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_token}",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate"
+        })
+
+    def _post(self, payload):
+        payload = {**payload, "actuals": payload["actuals"].to_json(orient="records", date_format="iso")}
+        url = f"{self.base_url}{self.endpoint}"
+        if self.wire_format == "json-gzip":
+            body = gzip.compress(json.dumps(payload, separators=(",", ":")).encode(), compresslevel=5)
+            response = self.session.post(url, data=body, headers={"Content-Encoding": "gzip"}, timeout=self.timeout)
+        else:
+            response = self.session.post(url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def th2forecast_api(self, actuals, fcast_horizon, group_target, target_var, date_var, models_list):
+        """
+        Drop-in for `ForecastingAPI.th2forecast_api` with a request timeout.
+
+        Args:
+            actuals (pd.DataFrame): Historical data used as input for forecasting.
+            fcast_horizon (int): The number of time points to forecast.
+            group_target (str, optional): Grouping variable, if applicable.
+            target_var (str): The target variable for forecasting.
+            date_var (str): The date variable in the input data.
+            models_list (list): A list of forecasting models to use.
+
+        Returns:
+            list: The parsed JSON response.
+        """
+        return self._post({
+            "actuals": actuals,
+            "fcast_horizon": fcast_horizon,
+            "group_target": group_target,
+            "target_var": target_var,
+            "date_var": date_var,
+            "models_list": models_list
+        })
+
+    def close(self):
+        """
+        Closes the pooled session.
+        """
+        self.session.close()
+
+
+class AsyncForecastingClient(ForecastingClient):
+    """
+    Asyncio variant of `ForecastingClient`.
+
+    Requests run on a background event loop with bounded concurrency and a
+    per-request timeout, which lets synchronous Streamlit code use it directly,
+    and share one pooled session across calls and sessions. The API is `submit`
+    (returns a `concurrent.futures.Future`, which an asyncio caller can await with
+    `asyncio.wrap_future`), `gather` and `th2forecast_api`.
+    """
+
+    def __init__(self, base_url, api_token, max_concurrency=8, timeout=120, wire_format="json"):
+        super().__init__(base_url, api_token, timeout, wire_format, pool_maxsize=max_concurrency)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="forecast-http")
+        self._loop = None
+        self._semaphore = None
+        self._loop_lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="forecast-loop", daemon=True).start()
+                self._semaphore = asyncio.run_coroutine_threadsafe(self._make_semaphore(), loop).result()
+                self._loop = loop
+            return self._loop
+
+    async def _make_semaphore(self):
+        return asyncio.Semaphore(self.max_concurrency)
+
+    async def _forecast(self, actuals, fcast_horizon, group_target, target_var, date_var, models_list):
+        # Runs on the background loop only, which owns the semaphore; `_post` runs on the executor,
+        # so serializing the actuals stays off the event loop
+        payload = {
+            "actuals": actuals,
+            "fcast_horizon": fcast_horizon,
+            "group_target": group_target,
+            "target_var": target_var,
+            "date_var": date_var,
+            "models_list": models_list
+        }
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await asyncio.wait_for(loop.run_in_executor(self._executor, partial(self._post, payload)), self.timeout)
+
+    def submit(self, **kwargs):
+        """
+        Schedules a forecast on the background event loop from synchronous code.
+
+        Args:
+            **kwargs: The arguments of `th2forecast_api`.
+
+        Returns:
+            concurrent.futures.Future: A future resolving to the parsed JSON response.
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._forecast(**kwargs), loop)
+
+    def gather(self, requests_kwargs):
+        """
+        Sends several forecast requests concurrently and waits for all of them.
+
+        Args:
+            requests_kwargs (list): A list of keyword-argument dicts, one per request.
+
+        Returns:
+            list: The parsed JSON responses, in the same order as `requests_kwargs`.
+        """
+        futures = [self.submit(**kwargs) for kwargs in requests_kwargs]
+        return [future.result() for future in futures]
+
+    def th2forecast_api(self, actuals, fcast_horizon, group_target, target_var, date_var, models_list):
+        """
+        Synchronous drop-in for `ForecastingAPI.th2forecast_api`, routed through the background loop.
+        """
+        return self.submit(
+            actuals=actuals, fcast_horizon=fcast_horizon, group_target=group_target,
+            target_var=target_var, date_var=date_var, models_list=models_list
+        ).result()
+
+    def close(self):
+        """
+        Stops the background event loop and closes the pooled session.
+        """
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+        self._executor.shutdown(wait=False)
+        super().close()
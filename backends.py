@@ -0,0 +1,279 @@
+import os
+import io
+import sys
+import gzip
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from config import FORECAST_API_CONFIG, FORECAST_REPLAY_FALLBACK, REPLAY_CONFIG
+from async_client import AsyncForecastingClient, ForecastingClient
+from local_engine import LocalForecastingEngine
+
+
+def request_fingerprint(actuals_json, fcast_horizon, group_target, target_var, date_var, models_list):
+    """
+    Identifies a forecast request by its wire payload, so recordings match across processes.
+
+    Args:
+        actuals_json (str): The actuals as sent on the wire (records-oriented JSON, ISO dates).
+        fcast_horizon (int): The number of time points to forecast.
+        group_target (str, optional): Grouping variable, if applicable.
+        target_var (str): The target variable for forecasting.
+        date_var (str): The date variable in the input data.
+        models_list (list): A list of forecasting models to use.
+
+    Returns:
+        str: A SHA-256 hex digest.
+    """
+    return hashlib.sha256(json.dumps({
+        "actuals": actuals_json,
+        "fcast_horizon": int(fcast_horizon),
+        "group_target": group_target,
+        "target_var": target_var,
+        "date_var": date_var,
+        "models_list": list(models_list),
+    }, sort_keys=True).encode()).hexdigest()
+
+
+class RecordingBackend:
+    """
+    Passes requests to another backend and saves each response for later replay.
+    """
+
+    def __init__(self, backend, recordings_dir="recordings"):
+        self.backend = backend
+        self.recordings_dir = recordings_dir
+        os.makedirs(recordings_dir, exist_ok=True)
+
+    @property
+    def models(self):
+        return getattr(self.backend, "models", ["xgboost", "arima", "random_forest"])
+
+    def th2forecast_api(self, actuals, fcast_horizon, group_target, target_var, date_var, models_list):
+        forecasts = self.backend.th2forecast_api(
+            actuals=actuals, fcast_horizon=fcast_horizon, group_target=group_target,
+            target_var=target_var, date_var=date_var, models_list=models_list
+        )
+        key = request_fingerprint(
+            actuals.to_json(orient="records", date_format="iso"), fcast_horizon, group_target, target_var, date_var, models_list
+        )
+        with open(os.path.join(self.recordings_dir, f"{key}.json"), "w") as file:
+            json.dump(forecasts, file)
+        return forecasts
+
+
+class ReplayBackend:
+    """
+    Answers forecast requests from recorded responses, with injected latency.
+
+    Each call sleeps `latency` seconds plus a uniform random `jitter` drawn from a
+    seeded generator, so benchmark runs are reproducible. Requests without a
+    recording go to `fallback` if given, and raise `KeyError` otherwise.
+    """
+
+    def __init__(self, recordings_dir="recordings", latency=0.0, jitter=0.0, seed=0, fallback=None):
+        self.recordings_dir = recordings_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.fallback = fallback
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def models(self):
+        return getattr(self.fallback, "models", ["xgboost", "arima", "random_forest"])
+
+    def _sleep(self):
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def replay(self, actuals_json, fcast_horizon, group_target, target_var, date_var, models_list):
+        """
+        Returns the recorded response of a request given in its wire form.
+
+        Args:
+            actuals_json (str): The actuals as sent on the wire.
+            fcast_horizon (int): The number of time points to forecast.
+            group_target (str, optional): Grouping variable, if applicable.
+            target_var (str): The target variable for forecasting.
+            date_var (str): The date variable in the input data.
+            models_list (list): A list of forecasting models to use.
+
+        Returns:
+            list: The recorded forecast records.
+
+        Raises:
+            KeyError: If there is no recording and no fallback.
+        """
+        self._sleep()
+        key = request_fingerprint(actuals_json, fcast_horizon, group_target, target_var, date_var, models_list)
+        path = os.path.join(self.recordings_dir, f"{key}.json")
+        if os.path.exists(path):
+            with self._lock:
+                self.hits += 1
+            with open(path) as file:
+                return json.load(file)
+        with self._lock:
+            self.misses += 1
+        if self.fallback is None:
+            raise KeyError(f"No recorded response for request {key}.")
+        actuals = pd.read_json(io.StringIO(actuals_json), orient="records", convert_dates=[date_var])
+        return self.fallback.th2forecast_api(
+            actuals=actuals, fcast_horizon=fcast_horizon, group_target=group_target,
+            target_var=target_var, date_var=date_var, models_list=models_list
+        )
+
+    def th2forecast_api(self, actuals, fcast_horizon, group_target, target_var, date_var, models_list):
+        return self.replay(
+            actuals.to_json(orient="records", date_format="iso"), fcast_horizon, group_target, target_var, date_var, models_list
+        )
+
+
+def _remote_backend():
+    from th2analytics_py.th2analytics.forecasting import ForecastingAPI
+
+    return ForecastingAPI(
+        base_url=FORECAST_API_CONFIG["base_url"],
+        api_token=FORECAST_API_CONFIG["api_token"]
+    )
+
+
+def _pooled_backend():
+    return ForecastingClient(
+        base_url=FORECAST_API_CONFIG["base_url"],
+        api_token=FORECAST_API_CONFIG["api_token"],
+        timeout=FORECAST_API_CONFIG["timeout"],
+        wire_format=FORECAST_API_CONFIG["wire_format"],
+        pool_maxsize=FORECAST_API_CONFIG["max_concurrency"]
+    )
+
+
+def _async_backend():
+    return AsyncForecastingClient(**FORECAST_API_CONFIG)
+
+
+def _replay_backend():
+    fallback = LocalForecastingEngine() if FORECAST_REPLAY_FALLBACK == "local" else None
+    return ReplayBackend(fallback=fallback, **REPLAY_CONFIG)
+
+
+def _recording_backend():
+    return RecordingBackend(_remote_backend(), REPLAY_CONFIG["recordings_dir"])
+
+
+# Forecasting backends selectable with FORECAST_API_CLIENT. Every backend exposes
+# `th2forecast_api` with the arguments and response records of the Thaink² API.
+BACKENDS = {
+    "sync": _remote_backend,
+    "pooled": _pooled_backend,
+    "async": _async_backend,
+    "local": LocalForecastingEngine,
+    "replay": _replay_backend,
+    "record": _recording_backend,
+}
+
+
+def create_backend(name):
+    """
+    Builds the forecasting backend registered under a name.
+
+    Args:
+        name (str): One of `BACKENDS`.
+
+    Returns:
+        object: The backend, exposing `th2forecast_api`.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown forecasting backend '{name}', expected one of {sorted(BACKENDS)}.")
+    return BACKENDS[name]()
+
+
+def make_replay_handler(backend):
+    """
+    Builds an HTTP handler serving `POST /thaink2/forecasting` from a `ReplayBackend`.
+    """
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            if self.path.rstrip("/").split("/")[-2:] != ["thaink2", "forecasting"]:
+                return self._respond(404, {"detail": "Not found"})
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            payload = json.loads(body)
+            try:
+                forecasts = backend.replay(
+                    payload["actuals"], payload["fcast_horizon"], payload["group_target"],
+                    payload["target_var"], payload["date_var"], payload["models_list"]
+                )
+            except KeyError as error:
+                return self._respond(404, {"detail": str(error)})
+            self._respond(200, forecasts)
+
+        def _respond(self, status, content):
+            data = json.dumps(content).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ReplayHandler
+
+
+def serve_replay(backend, host="127.0.0.1", port=8502):
+    """
+    Starts a local HTTP server that stands in for the forecasting API.
+
+    Args:
+        backend (ReplayBackend): The recordings to serve.
+        host (str): Interface to listen on.
+        port (int): Port to listen on; 0 picks a free one.
+
+    Returns:
+        ThreadingHTTPServer: The running server; point `API_URL` at `http://host:port/`.
+    """
+    server = ThreadingHTTPServer((host, port), make_replay_handler(backend))
+    threading.Thread(target=server.serve_forever, name="forecast-replay", daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve recorded forecasting API responses over HTTP.")
+    parser.add_argument("--recordings-dir", default=REPLAY_CONFIG["recordings_dir"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--latency", type=float, default=REPLAY_CONFIG["latency"], help="Seconds added to every response.")
+    parser.add_argument("--jitter", type=float, default=REPLAY_CONFIG["jitter"], help="Maximum random seconds added on top of the latency.")
+    parser.add_argument("--seed", type=int, default=REPLAY_CONFIG["seed"])
+    parser.add_argument("--fallback-local", action="store_true", help="Answer unrecorded requests with the local engine.")
+    args = parser.parse_args()
+    replay_server = serve_replay(
+        ReplayBackend(
+            args.recordings_dir, args.latency, args.jitter, args.seed,
+            fallback=LocalForecastingEngine() if args.fallback_local else None
+        ),
+        args.host, args.port
+    )
+    print(f"Serving recorded forecasts on http://{args.host}:{replay_server.server_port}/")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        replay_server.shutdown()
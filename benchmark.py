@@ -0,0 +1,214 @@
+import os
+import sys
+import json
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from synthetic_data import iter_sales_economics, write_sales_economics
+
+# Models of the local engine used by the stub backend
+BENCHMARK_MODELS = ["naive", "ets", "linear_ar"]
+
+# Spans recorded by the app's click path (see `timing`), reported per click, plus the whole click
+STAGES = [
+    "get_data", "filter", "get_api_forecasts", "forecast_api_call", "decode_forecasts",
+    "split_forecasts_by_model", "create_line_plot", "create_bar_chart", "click",
+]
+
+
+def summarize(samples):
+    """
+    Returns the p50/p95/mean of a list of millisecond samples.
+    """
+    values = np.asarray(samples)
+    return {
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "mean": float(values.mean()),
+        "n": int(values.size),
+    }
+
+
+def run_benchmark(horizons, model_counts, repeats, variable, cold_load=False):
+    """
+    Drives the "Generate Forecast" click path headlessly and times every stage.
+
+    Each click makes the same calls as `app.py`, inside a `timing` run: a `series_store` view,
+    `combine_original_normalized_forecasts` with the forecast cache cleared (so every request goes
+    through trimming, single-flight and retries to the backend), the split by model and the four
+    figures. Stage timings are read from the recorded spans; calls that run concurrently (the
+    forecast requests) are summed, so stages can add up to more than the click.
+
+    `utils` must already be configured (database and forecasting backend) through
+    environment variables, see `main`.
+
+    Args:
+        horizons (list): Forecast horizons to run.
+        model_counts (list): Numbers of models to compare.
+        repeats (int): Timed repetitions per configuration.
+        variable (str): The variable to forecast.
+        cold_load (bool): Whether to drop the stored series before each click, so `get_data` queries
+            the database as on a session's first rerun. Defaults to False (the series is already loaded
+            when the button is clicked).
+
+    Returns:
+        list: One entry per (horizon, model count) with per-stage latency summaries in milliseconds.
+    """
+    import utils
+    from data_store import series_store
+    from forecast_cache import forecast_cache
+    from timing import span, start_run
+
+    results = []
+    for horizon in horizons:
+        for model_count in model_counts:
+            models = BENCHMARK_MODELS[:model_count]
+            timings = {}
+            for _ in range(repeats):
+                if cold_load:
+                    series_store.invalidate(variable)
+                forecast_cache.clear()
+                run = start_run("benchmark")
+                with span("get_data", variable=variable):
+                    view = series_store.view(variable)
+                with view as data:
+                    with span("filter", variable=variable):
+                        filtered_data = data
+                        backtest_data = filtered_data.iloc[:-horizon]
+                    model_dict = utils.generate_model_dict(models)
+                    original_df, normalized_df = utils.combine_original_normalized_forecasts(
+                        filtered_data, backtest_data, horizon, models
+                    )
+                    min_value, max_value = filtered_data['value'].min(), filtered_data['value'].max()
+                    normalized_df['value'] = normalized_df['value01'] * (max_value - min_value) + min_value
+                    forecasts_original = utils.split_forecasts_by_model(original_df, model_dict)
+                    forecasts_normalized = utils.split_forecasts_by_model(normalized_df, model_dict)
+                    zoom_range = [filtered_data['date'].iloc[-20], original_df['date'].iloc[-1]]
+                    for forecasts_by_model in (forecasts_original, forecasts_normalized):
+                        utils.create_line_plot(filtered_data, forecasts_by_model, "", "Value", zoom_range)
+                    for forecasts_by_model in (forecasts_original, forecasts_normalized):
+                        utils.create_bar_chart(filtered_data, forecasts_by_model, "", "Value", zoom_range)
+                timings.setdefault("click", []).append(run.finish())
+                for row in run.summary():
+                    timings.setdefault(row["span"], []).append(row["total_ms"])
+            results.append({
+                "horizon": horizon,
+                "n_models": model_count,
+                "stages": {stage: summarize(timings[stage]) for stage in STAGES if stage in timings},
+            })
+            click = results[-1]["stages"]["click"]
+            print(f"horizon={horizon:>3} models={model_count}  click p50={click['p50']:8.1f} ms  p95={click['p95']:8.1f} ms")
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.abspath(os.path.dirname(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_in_workdir(args, workdir):
+    """
+    Sets up the synthetic database and replay backend in `workdir` and runs the benchmark.
+
+    Returns:
+        tuple: The benchmarked variable and the results of `run_benchmark`.
+    """
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{os.path.join(workdir, 'sales_economics.db')}"
+        write_sales_economics(
+            iter_sales_economics(args.variables, n_periods=args.periods, freq=args.freq, seed=args.seed), database_url
+        )
+    # Configure utils before it is imported: stand-in database and a replay backend with no
+    # recordings, answered by the local engine with injected latency.
+    os.environ.update({
+        "DATABASE_URL": database_url,
+        "FORECAST_API_CLIENT": "replay",
+        "FORECAST_REPLAY_DIR": os.path.join(workdir, "recordings"),
+        "FORECAST_REPLAY_FALLBACK": "local",
+        "FORECAST_REPLAY_LATENCY": str(args.latency),
+        "FORECAST_REPLAY_JITTER": str(args.jitter),
+        "FORECAST_REPLAY_SEED": str(args.seed),
+    })
+    for name in ("DATA_SNAPSHOT_DIR", "FORECAST_CACHE_DIR"):
+        os.environ.pop(name, None)
+    import utils
+
+    try:
+        variable = args.variable or str(pd.read_sql_query(
+            "SELECT MIN(variable) AS variable FROM sales_economics;", utils.get_engine()
+        )["variable"].iloc[0])
+        results = run_benchmark(
+            args.horizons, [count for count in args.models if 1 <= count <= len(BENCHMARK_MODELS)], args.repeats, variable, args.cold_load
+        )
+    finally:
+        # Close pooled SQLite connections so the work directory can be removed
+        utils.dispose_engine()
+    return variable, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the forecast click path against a stub backend and synthetic data.")
+    parser.add_argument("--horizons", type=int, nargs="+", default=[1, 12, 30, 60, 90])
+    parser.add_argument("--models", type=int, nargs="+", default=[1, 2, 3], help="Numbers of models to compare (1-3).")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--variables", type=int, default=5, help="Variables in the synthetic dataset.")
+    parser.add_argument("--periods", type=int, default=600, help="Dates per variable in the synthetic dataset.")
+    parser.add_argument("--freq", default="MS", help="Pandas frequency of the synthetic dates.")
+    parser.add_argument("--database-url", help="Use an existing sales_economics database instead of a synthetic SQLite one.")
+    parser.add_argument("--variable", help="Variable to forecast. Defaults to the first one.")
+    parser.add_argument("--cold-load", action="store_true", help="Reload the series from the database before every click.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds of latency injected into every stub API call.")
+    parser.add_argument("--jitter", type=float, default=0.02, help="Maximum random seconds added to the latency.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON results path. Defaults to benchmark_results/bench-<timestamp>.json.")
+    args = parser.parse_args()
+
+    # The synthetic database and recordings are removed once the run is over
+    with tempfile.TemporaryDirectory(prefix="thaink2-bench-") as workdir:
+        variable, results = run_in_workdir(args, workdir)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "database": "synthetic sqlite" if args.database_url is None else "external",
+            "variable": variable,
+            "variables": args.variables,
+            "periods": args.periods,
+            "freq": args.freq,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "seed": args.seed,
+            "repeats": args.repeats,
+            "cold_load": args.cold_load,
+            "models": BENCHMARK_MODELS,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        "benchmark_results", f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from a .env file
+load_dotenv()
+
+# Database connection parameters loaded from environment variables
+DB_CONFIG = {
+    "host": os.getenv("DB_HOST"),
+    "database": os.getenv("DB_NAME"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASSWORD"),
+    "port": os.getenv("DB_PORT"),
+}
+
+# Optional SQLAlchemy URL overriding DB_CONFIG, e.g. a local SQLite stand-in for benchmarks
+DATABASE_URL = os.getenv("DATABASE_URL") or None
+
+# Connection pool parameters for the shared SQLAlchemy engine
+DB_POOL_CONFIG = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+}
+
+# Floating point dtype of the `value` and `value01` columns once loaded (float32 halves their memory)
+DATA_VALUE_DTYPE = os.getenv("DATA_VALUE_DTYPE", "float64")
+
+# Number of rows fetched per round trip by the streaming loaders
+DB_CHUNK_SIZE = int(os.getenv("DB_CHUNK_SIZE", "50000"))
+
+# Directory holding local Arrow IPC snapshots of loaded data; snapshots are disabled when unset
+SNAPSHOT_DIR = os.getenv("DATA_SNAPSHOT_DIR") or None
+
+# Forecasting backend, see `backends.BACKENDS`
+FORECAST_API_CLIENT = os.getenv("FORECAST_API_CLIENT", "sync")
+
+# Thaink² API connection parameters shared by the remote backends
+FORECAST_API_CONFIG = {
+    "base_url": os.getenv("API_URL"),
+    "api_token": os.getenv("THAINK2_API_TOKEN"),
+    "max_concurrency": int(os.getenv("FORECAST_API_MAX_CONCURRENCY", "8")),
+    "timeout": float(os.getenv("FORECAST_API_TIMEOUT", "120")),
+    "wire_format": os.getenv("FORECAST_API_WIRE_FORMAT", "json"),
+}
+
+# Maximum number of forecast requests sent to the API at the same time
+FORECAST_MAX_WORKERS = int(os.getenv("FORECAST_MAX_WORKERS", "4"))
+
+# Trailing history (in rows per series) each model needs, e.g. FORECAST_LOOKBACK_WINDOWS="arima=240,xgboost=120".
+# Models without a window are sent the full history.
+MODEL_LOOKBACK_WINDOWS = {
+    model.strip(): int(window)
+    for model, window in (
+        item.split("=") for item in os.getenv("FORECAST_LOOKBACK_WINDOWS", "").split(",") if item.strip()
+    )
+}
+
+# Retry policy of the forecast API calls
+RESILIENCE_CONFIG = {
+    "max_attempts": int(os.getenv("FORECAST_API_RETRIES", "3")),
+    "deadline": float(os.getenv("FORECAST_API_DEADLINE", "180")),
+    "attempt_timeout": FORECAST_API_CONFIG["timeout"],
+}
+
+# Circuit breaker of the forecast API
+BREAKER_CONFIG = {
+    "failure_threshold": int(os.getenv("FORECAST_BREAKER_THRESHOLD", "5")),
+    "reset_timeout": float(os.getenv("FORECAST_BREAKER_RESET", "30")),
+}
+
+# Forecast cache parameters
+CACHE_CONFIG = {
+    "maxsize": int(os.getenv("FORECAST_CACHE_SIZE", "256")),
+    "ttl": float(os.getenv("FORECAST_CACHE_TTL", "3600")),
+    "cache_dir": os.getenv("FORECAST_CACHE_DIR") or None,
+    "max_files": int(os.getenv("FORECAST_CACHE_MAX_FILES", "1024")),
+}
+
+# Recorded-response replay parameters
+REPLAY_CONFIG = {
+    "recordings_dir": os.getenv("FORECAST_REPLAY_DIR", "recordings"),
+    "latency": float(os.getenv("FORECAST_REPLAY_LATENCY", "0")),
+    "jitter": float(os.getenv("FORECAST_REPLAY_JITTER", "0")),
+    "seed": int(os.getenv("FORECAST_REPLAY_SEED", "0")),
+}
+
+# Backend answering the requests missing from the recordings ("local"), if any
+FORECAST_REPLAY_FALLBACK = os.getenv("FORECAST_REPLAY_FALLBACK") or None
+
+# Timing instrumentation parameters
+TIMING_CONFIG = {
+    "enabled": os.getenv("TIMING_ENABLED", "1") == "1",
+    "log_file": os.getenv("TIMING_LOG_FILE") or None,
+    "prometheus_file": os.getenv("TIMING_PROMETHEUS_FILE") or None,
+    "otel": os.getenv("TIMING_OTEL", "0") == "1",
+}
+
+# Always show the timing breakdown in the app, not only with `?debug=1`
+APP_DEBUG = os.getenv("APP_DEBUG", "0") == "1"
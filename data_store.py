@@ -0,0 +1,304 @@
+import os
+import sys
+import threading
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from utils import load_data_from_data_base, load_variable_from_data_base, normalize_sales_economics
+
+
+class IndexedDataset:
+    """
+    A `sales_economics` frame with a precomputed variable -> row slice index.
+
+    Rows are sorted by (variable, date), so each series is one contiguous block and
+    selecting it is an O(1) positional slice instead of a boolean mask over the
+    whole `variable` column.
+    """
+
+    def __init__(self, df):
+        if not self._is_normalized(df):
+            df = normalize_sales_economics(df)
+        codes = df["variable"].cat.codes.to_numpy()
+        self.data = df
+        starts = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], starts)) if len(codes) else starts
+        stops = np.append(starts[1:], len(codes))
+        categories = df["variable"].cat.categories
+        self._slices = {
+            categories[codes[start]]: slice(int(start), int(stop))
+            for start, stop in zip(starts, stops)
+            if codes[start] >= 0
+        }
+
+    @staticmethod
+    def _is_normalized(df):
+        # Normalizing is skipped only for categorical variables in non-decreasing code order with
+        # datetime dates non-decreasing within every variable block
+        if not isinstance(df["variable"].dtype, pd.CategoricalDtype) or not pd.api.types.is_datetime64_dtype(df["date"]):
+            return False
+        if len(df) < 2:
+            return True
+        code_steps = np.diff(df["variable"].cat.codes.to_numpy())
+        if (code_steps < 0).any():
+            return False
+        date_steps = np.diff(df["date"].to_numpy().view(np.int64))
+        return not (date_steps[code_steps == 0] < 0).any()
+
+    @property
+    def variables(self):
+        """
+        Returns the variables present in the dataset, in sorted order.
+        """
+        return list(self._slices)
+
+    def __contains__(self, variable):
+        return variable in self._slices
+
+    def __len__(self):
+        return len(self.data)
+
+    def series(self, variable):
+        """
+        Returns the rows of one variable without scanning or copying the dataset.
+
+        Args:
+            variable (str): The variable to select.
+
+        Returns:
+            pd.DataFrame: A positional slice of the dataset, ordered by date.
+        """
+        if variable not in self._slices:
+            raise KeyError(f"Unknown variable: {variable}")
+        return self.data.iloc[self._slices[variable]]
+
+
+class SeriesView:
+    """
+    A reference-counted, read-only handle on one stored series.
+
+    The view pins the frame that was current when it was acquired: invalidating
+    or refreshing the store swaps in a new frame for later readers, while the old
+    one stays alive until its last view is released. Use it as a context manager.
+    """
+
+    def __init__(self, store, variable, data, generation):
+        self._store = store
+        self.variable = variable
+        self.data = data
+        self.generation = generation
+        self._released = False
+
+    def release(self):
+        """
+        Releases the view; calling it more than once has no effect.
+        """
+        if not self._released:
+            self._released = True
+            self._store._release(self)
+            self.data = None
+
+    def __enter__(self):
+        return self.data
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class SeriesStore:
+    """
+    Process-wide, shared store of `sales_economics` series with incremental refresh.
+
+    Each variable is loaded once in full and the same frame is shared by every
+    session; readers must treat it as read-only. Afterwards the store remembers
+    the latest loaded `date` (the watermark) and `refresh` only fetches rows newer
+    than it, appending them to a new stored frame.
+    """
+
+    def __init__(self, loader=load_variable_from_data_base):
+        self._loader = loader
+        self._frames = {}
+        self._watermarks = {}
+        self._generations = {}
+        self._view_counts = {}
+        # `_lock` guards the dictionaries only and is never held during a query; loads and refreshes
+        # of one variable are serialized by its own lock, so they do not block other variables
+        self._lock = threading.Lock()
+        self._load_locks = {}
+
+    def get(self, variable):
+        """
+        Returns the stored series for a variable, loading it in full on first access.
+
+        Args:
+            variable (str): The variable to return.
+
+        Returns:
+            pd.DataFrame: The rows of the variable, ordered by date.
+        """
+        while True:
+            self._ensure_loaded(variable)
+            with self._lock:
+                if variable in self._frames:
+                    return self._frames[variable]
+
+    def view(self, variable):
+        """
+        Acquires a reference-counted view on a variable's current series, loading it on first access.
+
+        Args:
+            variable (str): The variable to view.
+
+        Returns:
+            SeriesView: The view; release it, or use it as a context manager, once done.
+        """
+        while True:
+            self._ensure_loaded(variable)
+            with self._lock:
+                # The variable may have been invalidated since it was loaded
+                if variable not in self._frames:
+                    continue
+                generation = self._generations[variable]
+                key = (variable, generation)
+                self._view_counts[key] = self._view_counts.get(key, 0) + 1
+                return SeriesView(self, variable, self._frames[variable], generation)
+
+    def preload(self, loader=load_data_from_data_base):
+        """
+        Loads every variable with a single full-table query, replacing any stored series.
+
+        Args:
+            loader (callable): Returns the whole `sales_economics` table.
+
+        Returns:
+            list: The variables now held by the store.
+        """
+        dataset = IndexedDataset(loader())
+        # Each frame keeps only its own category, like a per-variable load, so refreshed rows
+        # concatenate without falling back to an object `variable` column
+        frames = {}
+        for variable in dataset.variables:
+            df = dataset.series(variable).reset_index(drop=True)
+            df["variable"] = df["variable"].cat.remove_unused_categories()
+            frames[variable] = df
+        with self._lock:
+            for variable, df in frames.items():
+                self._set(variable, df)
+        return dataset.variables
+
+    def refresh(self, variable):
+        """
+        Fetches rows newer than the variable's watermark and appends them to the stored series.
+
+        Args:
+            variable (str): The variable to refresh.
+
+        Returns:
+            int: The number of new rows appended.
+        """
+        with self._variable_lock(variable):
+            with self._lock:
+                loaded = variable in self._frames
+                watermark = self._watermarks.get(variable)
+            if not loaded:
+                df = self._loader(variable)
+                with self._lock:
+                    self._set(variable, df)
+                return len(df)
+            fetched = self._loader(variable, after_date=watermark)
+            while True:
+                with self._lock:
+                    current = self._frames.get(variable)
+                    watermark = self._watermarks.get(variable)
+                # Dropped while the query ran: the next access reloads it in full
+                if current is None:
+                    return 0
+                # Guard against backends whose date comparison is not exact, so rows are never appended twice
+                new_rows = fetched[fetched["date"] > watermark] if watermark is not None and not fetched.empty else fetched
+                if new_rows.empty:
+                    return 0
+                df = pd.concat([current, new_rows], ignore_index=True)
+                with self._lock:
+                    # Retry if the series was replaced, e.g. by `preload`, while appending
+                    if self._frames.get(variable) is current:
+                        self._set(variable, df)
+                        return len(new_rows)
+
+    def watermark(self, variable):
+        """
+        Returns the latest loaded date of a variable, or None if it has not been loaded.
+        """
+        return self._watermarks.get(variable)
+
+    def invalidate(self, variable=None):
+        """
+        Drops one stored variable, or every variable, so the next access reloads it in full.
+
+        Args:
+            variable (str, optional): The variable to drop. Defaults to None, which drops everything.
+        """
+        with self._lock:
+            if variable is None:
+                self._frames.clear()
+                self._watermarks.clear()
+            else:
+                self._frames.pop(variable, None)
+                self._watermarks.pop(variable, None)
+
+    def stats(self):
+        """
+        Returns the stored series and the number of live views on each of their generations.
+
+        Returns:
+            dict: A dictionary where keys are variables and values describe rows, memory, current
+            generation and live view counts per generation.
+        """
+        with self._lock:
+            stats = {
+                variable: {
+                    "rows": len(df),
+                    "memory_bytes": int(df.memory_usage(deep=True).sum()),
+                    "generation": self._generations[variable],
+                    "views": {},
+                }
+                for variable, df in self._frames.items()
+            }
+            for (variable, generation), count in self._view_counts.items():
+                stats.setdefault(variable, {"rows": 0, "memory_bytes": 0, "generation": None, "views": {}})
+                stats[variable]["views"][generation] = count
+            return stats
+
+    def _variable_lock(self, variable):
+        with self._lock:
+            return self._load_locks.setdefault(variable, threading.Lock())
+
+    def _ensure_loaded(self, variable):
+        # Loads a missing variable outside the store lock; concurrent first accesses share one query
+        with self._lock:
+            if variable in self._frames:
+                return
+        with self._variable_lock(variable):
+            with self._lock:
+                if variable in self._frames:
+                    return
+            df = self._loader(variable)
+            with self._lock:
+                self._set(variable, df)
+
+    def _release(self, view):
+        with self._lock:
+            key = (view.variable, view.generation)
+            self._view_counts[key] -= 1
+            if not self._view_counts[key]:
+                del self._view_counts[key]
+
+    def _set(self, variable, df):
+        self._frames[variable] = df
+        self._watermarks[variable] = df['date'].max() if not df.empty else None
+        self._generations[variable] = self._generations.get(variable, 0) + 1
+
+
+# Process-wide store shared by every Streamlit session
+series_store = SeriesStore()
@@ -0,0 +1,260 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import Future
+from cachetools import LRUCache, TTLCache
+import pandas as pd
+
+from config import CACHE_CONFIG
+
+
+def make_forecast_key(actuals, fcast_horizon, group_target, target_var, date_var, models_list):
+    """
+    Builds a content-addressed cache key for a forecast request.
+
+    Args:
+        actuals (pd.DataFrame): Historical data used as input for forecasting.
+        fcast_horizon (int): The number of time points to forecast.
+        group_target (str, optional): Grouping variable, if applicable.
+        target_var (str): The target variable for forecasting.
+        date_var (str): The date variable in the input data.
+        models_list (list): A list of forecasting models to use.
+
+    Returns:
+        str: A SHA-256 hex digest of the series contents and request parameters.
+    """
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(actuals, index=False).values.tobytes())
+    digest.update(json.dumps({
+        "columns": [str(column) for column in actuals.columns],
+        "fcast_horizon": int(fcast_horizon),
+        "group_target": group_target,
+        "target_var": target_var,
+        "date_var": date_var,
+        "models_list": sorted(models_list),
+    }, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class ForecastCache:
+    """
+    Two-tier cache of forecast results with size and TTL eviction.
+
+    The memory tier is a `cachetools.TTLCache`. The optional disk tier stores one
+    Parquet file per key in `cache_dir`, so results are shared between server
+    processes and survive restarts. Expired results are kept in a size-bounded
+    stale tier, served by `get_stale` only when the backend is unavailable.
+    """
+
+    def __init__(self, maxsize=256, ttl=3600, cache_dir=None, max_files=1024):
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.max_files = max_files
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._stale = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.parquet")
+
+    def get(self, key):
+        """
+        Looks up a forecast result, checking memory first and then disk.
+
+        Args:
+            key (str): The cache key, see `make_forecast_key`.
+
+        Returns:
+            pd.DataFrame or None: A copy of the cached result, or None on a miss.
+        """
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self.memory_hits += 1
+                return result.copy()
+        result = self._read_disk(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._memory[key] = result
+        return result.copy()
+
+    def set(self, key, result):
+        """
+        Stores a forecast result in both tiers.
+
+        Args:
+            key (str): The cache key, see `make_forecast_key`.
+            result (pd.DataFrame): The forecast result to cache.
+        """
+        result = result.copy()
+        with self._lock:
+            self._memory[key] = result
+            self._stale[key] = result
+        self._write_disk(key, result)
+
+    def get_stale(self, key):
+        """
+        Looks up a forecast result regardless of its age, as a fallback when the backend fails.
+
+        Args:
+            key (str): The cache key, see `make_forecast_key`.
+
+        Returns:
+            pd.DataFrame or None: A copy of the last known result, or None if there is none.
+        """
+        with self._lock:
+            result = self._stale.get(key)
+        if result is None:
+            result = self._read_disk(key, ignore_ttl=True)
+        if result is None:
+            return None
+        with self._lock:
+            self.stale_hits += 1
+        return result.copy()
+
+    def _read_disk(self, key, ignore_ttl=False):
+        # Expired files are kept for `get_stale` until `max_files` eviction removes them
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            if not ignore_ttl and time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            return pd.read_parquet(path)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, result):
+        if not self.cache_dir:
+            return
+        tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+        try:
+            result.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, ValueError):
+            return
+        self._evict_disk()
+
+    def _evict_disk(self):
+        paths = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".parquet")
+        ]
+        if len(paths) <= self.max_files:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Empties both tiers and resets the hit/miss counters.
+        """
+        with self._lock:
+            self._memory.clear()
+            self._stale.clear()
+            self.memory_hits = self.disk_hits = self.misses = self.stale_hits = 0
+        if self.cache_dir:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".parquet"):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def stats(self):
+        """
+        Returns the cache counters, used to size the cache.
+
+        Returns:
+            dict: Hit/miss counters, hit rate and current memory tier size.
+        """
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "size": len(self._memory),
+                "maxsize": self._memory.maxsize,
+            }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is in
+    flight wait for it and receive the same result (or exception). Nothing is kept
+    once the call completes, so it complements rather than replaces `ForecastCache`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        """
+        Runs `fn` once for all concurrent callers of `key`.
+
+        Args:
+            key (str): The request fingerprint, see `make_forecast_key`.
+            fn (callable): Produces the result; called without arguments.
+
+        Returns:
+            tuple: The result, and whether it was shared from another caller's in-flight call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return call.result(), True
+        try:
+            result = fn()
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self):
+        """
+        Returns the number of executed and coalesced calls.
+
+        Returns:
+            dict: Executed calls, coalesced calls and calls currently in flight.
+        """
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+
+# Process-wide forecast cache shared by every Streamlit session
+forecast_cache = ForecastCache(**CACHE_CONFIG)
+
+# Process-wide coalescing of identical in-flight forecast requests
+forecast_single_flight = SingleFlight()
@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+# Season length used by seasonal models, keyed on the pandas frequency prefix
+SEASON_LENGTHS = {"MS": 12, "ME": 12, "M": 12, "QS": 4, "QE": 4, "Q": 4, "W": 52, "D": 7, "B": 5, "h": 24, "H": 24}
+
+
+def infer_frequency(dates):
+    """
+    Infers the sampling frequency of a date series.
+
+    Args:
+        dates (pd.Series): Ordered dates.
+
+    Returns:
+        pd.DateOffset: The inferred frequency, falling back to the median spacing.
+    """
+    dates = pd.DatetimeIndex(dates)
+    freq = pd.infer_freq(dates) if len(dates) >= 3 else None
+    if freq is not None:
+        return pd.tseries.frequencies.to_offset(freq)
+    if len(dates) >= 2:
+        return pd.tseries.frequencies.to_offset(pd.Timedelta(np.median(np.diff(dates.asi8))))
+    return pd.tseries.frequencies.to_offset("D")
+
+
+def season_length(freq):
+    """
+    Returns the seasonal period of a frequency, e.g. 12 for monthly data.
+    """
+    name = freq.name if hasattr(freq, "name") else str(freq)
+    return SEASON_LENGTHS.get(name.split("-")[0], 1)
+
+
+def naive(y, horizon, season):
+    """
+    Repeats the last observation.
+    """
+    return np.full(horizon, y[-1], dtype=np.float64)
+
+
+def seasonal_naive(y, horizon, season):
+    """
+    Repeats the last observed season; falls back to `naive` on short histories.
+    """
+    if season <= 1 or len(y) < season:
+        return naive(y, horizon, season)
+    return y[-season:][np.arange(horizon) % season]
+
+
+def ets(y, horizon, season, grid=np.linspace(0.05, 0.95, 10)):
+    """
+    Holt's additive-trend exponential smoothing with smoothing parameters fitted on a grid.
+
+    Every (alpha, beta) pair of the grid is filtered at once as a NumPy vector, and the pair
+    with the lowest one-step-ahead squared error is used for the forecast.
+    """
+    if len(y) < 3:
+        return naive(y, horizon, season)
+    alpha, beta = (values.ravel() for values in np.meshgrid(grid, grid))
+    level = np.full(alpha.shape, y[0])
+    trend = np.full(alpha.shape, y[1] - y[0])
+    sse = np.zeros(alpha.shape)
+    for value in y[1:]:
+        prediction = level + trend
+        sse += (value - prediction) ** 2
+        new_level = alpha * value + (1 - alpha) * prediction
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        level = new_level
+    best = np.argmin(sse)
+    return level[best] + trend[best] * np.arange(1, horizon + 1)
+
+
+def linear_ar(y, horizon, season, max_order=12):
+    """
+    Autoregressive model with intercept fitted by least squares, forecast recursively.
+    """
+    order = min(max(season, 1), max_order, len(y) // 3)
+    if order < 1:
+        return naive(y, horizon, season)
+    lags = np.lib.stride_tricks.sliding_window_view(y[:-1], order)
+    design = np.column_stack([np.ones(len(lags)), lags])
+    coefficients, *_ = np.linalg.lstsq(design, y[order:], rcond=None)
+    history = np.empty(order + horizon)
+    history[:order] = y[-order:]
+    for step in range(horizon):
+        history[order + step] = coefficients[0] + history[step:order + step] @ coefficients[1:]
+    return history[order:]
+
+
+class LocalForecastingEngine:
+    """
+    In-process stand-in for `ForecastingAPI` built on fast NumPy baselines.
+
+    `th2forecast_api` takes the same arguments and returns the same records
+    (`.model_id`, `.index`, `.value`, plus the group column for grouped requests)
+    as the remote API, so it can be used wherever the API client is, with no
+    network round trip.
+    """
+
+    models = {
+        "naive": naive,
+        "seasonal_naive": seasonal_naive,
+        "ets": ets,
+        "linear_ar": linear_ar,
+    }
+
+    def th2forecast_api(self, actuals, fcast_horizon, group_target, target_var, date_var, models_list):
+        """
+        Forecasts every series of `actuals` with each requested model.
+
+        Args:
+            actuals (pd.DataFrame): Historical data used as input for forecasting.
+            fcast_horizon (int): The number of time points to forecast.
+            group_target (str, optional): Grouping variable, if applicable.
+            target_var (str): The target variable for forecasting.
+            date_var (str): The date variable in the input data.
+            models_list (list): A list of forecasting models to use, from `models`.
+
+        Returns:
+            list: Forecast records, in the format of the remote API response.
+        """
+        unknown = [model for model in models_list if model not in self.models]
+        if unknown:
+            raise ValueError(f"Unknown local forecasting models: {unknown}")
+        if group_target:
+            groups = actuals.groupby(group_target, sort=False, observed=True)
+        else:
+            groups = [(None, actuals)]
+        records = []
+        for group, series in groups:
+            series = series.sort_values(date_var)
+            dates = pd.to_datetime(series[date_var])
+            y = series[target_var].to_numpy(dtype=np.float64)
+            y = y[~np.isnan(y)] if np.isnan(y).any() else y
+            if not len(y):
+                continue
+            freq = infer_frequency(dates)
+            season = season_length(freq)
+            future_dates = pd.date_range(dates.iloc[-1], periods=fcast_horizon + 1, freq=freq)[1:]
+            date_format = "%Y-%m-%d" if (future_dates == future_dates.normalize()).all() else "%Y-%m-%dT%H:%M:%S"
+            future_dates = future_dates.strftime(date_format)
+            for model_id, model in enumerate(models_list, start=1):
+                values = self.models[model](y, fcast_horizon, season)
+                for date, value in zip(future_dates, values.tolist()):
+                    record = {".model_id": model_id, ".index": date, ".value": value}
+                    if group_target:
+                        record[group_target] = group
+                    records.append(record)
+        return records
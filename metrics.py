@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+
+def align_forecasts_with_actuals(forecasts, actuals, target_var="value", date_var="date"):
+    """
+    Aligns the forecasts of every model with the actual values on date.
+
+    Forecast dates without an actual value (the future part of a forecast) are dropped.
+
+    Args:
+        forecasts (dict): A dictionary where keys are model names and values are DataFrames of
+            forecast data, as returned by `split_forecasts_by_model`.
+        actuals (pd.DataFrame): Historical data.
+        target_var (str): The forecast and actual value column.
+        date_var (str): The date column.
+
+    Returns:
+        pd.DataFrame: One row per model and date with `model`, `date`, `forecast` and `actual` columns.
+    """
+    if not forecasts:
+        return pd.DataFrame(columns=["model", date_var, "forecast", "actual"])
+    stacked = pd.concat(
+        {model: df[[date_var, target_var]] for model, df in forecasts.items()},
+        names=["model", None]
+    ).reset_index(level="model").rename(columns={target_var: "forecast"})
+    return stacked.merge(
+        actuals[[date_var, target_var]].rename(columns={target_var: "actual"}), on=date_var, how="inner"
+    )
+
+
+def compute_accuracy_metrics(aligned, by="model", forecast_col="forecast", actual_col="actual"):
+    """
+    Computes MAE, RMSE, MAPE, sMAPE and bias for every group in one vectorized pass.
+
+    Errors are reduced per group with `np.bincount`, so the cost does not depend on the
+    number of models or folds beyond the number of rows. MAPE skips zero actuals.
+
+    Args:
+        aligned (pd.DataFrame): Forecasts and actuals, e.g. from `align_forecasts_with_actuals`.
+        by (str or list): Column(s) identifying a group, e.g. "model" or ["model", "fold"].
+        forecast_col (str): The forecast value column.
+        actual_col (str): The actual value column.
+
+    Returns:
+        pd.DataFrame: One row per group with `n`, `mae`, `rmse`, `mape`, `smape` and `bias`
+        (forecast minus actual), sorted by RMSE. Percentages are on a 0-100 scale.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    if aligned.empty:
+        return pd.DataFrame(columns=by + ["n", "mae", "rmse", "mape", "smape", "bias"])
+    keys = aligned[by]
+    codes, uniques = pd.factorize(pd.MultiIndex.from_frame(keys) if len(by) > 1 else keys[by[0]])
+    forecast = aligned[forecast_col].to_numpy(dtype=np.float64)
+    actual = aligned[actual_col].to_numpy(dtype=np.float64)
+    valid = ~(np.isnan(forecast) | np.isnan(actual))
+    codes, forecast, actual = codes[valid], forecast[valid], actual[valid]
+    error = forecast - actual
+    abs_error = np.abs(error)
+    groups = len(uniques)
+    count = np.bincount(codes, minlength=groups)
+    nonzero = actual != 0
+    scale = np.abs(actual) + np.abs(forecast)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ape = np.where(nonzero, abs_error / np.abs(actual), 0.0)
+        sape = np.where(scale > 0, 2 * abs_error / scale, 0.0)
+        metrics = pd.DataFrame({
+            "n": count,
+            "mae": np.bincount(codes, abs_error, groups) / count,
+            "rmse": np.sqrt(np.bincount(codes, error ** 2, groups) / count),
+            "mape": 100 * np.bincount(codes, ape, groups) / np.bincount(codes, nonzero, groups),
+            "smape": 100 * np.bincount(codes, sape, groups) / count,
+            "bias": np.bincount(codes, error, groups) / count,
+        })
+    group_frame = uniques.to_frame(index=False) if len(by) > 1 else pd.DataFrame({by[0]: uniques})
+    group_frame.columns = by
+    return pd.concat([group_frame, metrics], axis=1).sort_values("rmse", ignore_index=True)
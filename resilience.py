@@ -0,0 +1,144 @@
+import time
+import threading
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, stop_before_delay, wait_random_exponential
+
+from config import BREAKER_CONFIG, FORECAST_API_CONFIG, RESILIENCE_CONFIG
+
+# Attempts run on these threads so a hung request cannot block the caller past its deadline
+_attempt_executor = ThreadPoolExecutor(
+    max_workers=FORECAST_API_CONFIG["max_concurrency"],
+    thread_name_prefix="forecast-attempt"
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling the backend while the circuit breaker is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Fails fast after repeated backend errors.
+
+    After `failure_threshold` consecutive failures the breaker opens and every call
+    raises `CircuitOpenError`. Once `reset_timeout` seconds have passed, a single
+    trial call is let through (half-open): success closes the breaker, failure
+    opens it again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Checks whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a trial call already running.
+        """
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError("Forecasting backend circuit is open.")
+                self.state = "half_open"
+                return
+            if self.state == "half_open":
+                raise CircuitOpenError("Forecasting backend circuit is half-open, trial call in progress.")
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+    def stats(self):
+        """
+        Returns the breaker state and consecutive failure count.
+        """
+        with self._lock:
+            return {"state": self.state, "failures": self.failures}
+
+
+def is_retryable(error):
+    """
+    Tells whether a failed call is worth retrying: connection errors, timeouts, 429 and 5xx responses.
+
+    Args:
+        error (BaseException): The error raised by the call.
+
+    Returns:
+        bool: True for transient errors.
+    """
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is None or status == 429 or status >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout, TimeoutError, concurrent.futures.TimeoutError))
+
+
+def call_with_retries(fn, breaker=None, max_attempts=3, deadline=180, attempt_timeout=120):
+    """
+    Calls `fn` with jittered exponential backoff, bounded by an overall deadline.
+
+    Args:
+        fn (callable): The call to make; takes no arguments.
+        breaker (CircuitBreaker, optional): Breaker consulted before and updated after each attempt.
+        max_attempts (int): Maximum number of attempts.
+        deadline (float): Seconds after which no further attempt or wait is started.
+        attempt_timeout (float): Seconds to wait for a single attempt.
+
+    Returns:
+        The result of `fn`.
+
+    Raises:
+        CircuitOpenError: If the breaker is open.
+        Exception: The last error, once retries are exhausted or the error is not transient.
+    """
+    start = time.monotonic()
+
+    def attempt():
+        if breaker is not None:
+            breaker.before_call()
+        remaining = max(deadline - (time.monotonic() - start), 0)
+        future = _attempt_executor.submit(fn)
+        try:
+            result = future.result(timeout=min(attempt_timeout, remaining))
+        except BaseException as error:
+            # An attempt still queued when its caller gives up must never reach the backend; one
+            # already running ends with the client's own request timeout
+            future.cancel()
+            if breaker is not None:
+                if is_retryable(error):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+    retrying = Retrying(
+        stop=stop_after_attempt(max_attempts) | stop_before_delay(deadline),
+        wait=wait_random_exponential(multiplier=0.5, max=10),
+        retry=retry_if_exception(is_retryable),
+        reraise=True
+    )
+    return retrying(attempt)
+
+
+# Process-wide circuit breaker for the forecasting backend
+forecast_breaker = CircuitBreaker(**BREAKER_CONFIG)
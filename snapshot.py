@@ -0,0 +1,79 @@
+import os
+import re
+import json
+import threading
+import pyarrow as pa
+
+from config import SNAPSHOT_DIR
+
+_VERSION_KEY = b"thaink2.version"
+
+
+def snapshot_path(name, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Returns the file path of a named snapshot.
+
+    Args:
+        name (str): The snapshot name, e.g. `sales_economics` or `sales_economics-pce`.
+        snapshot_dir (str): Directory holding the snapshots.
+
+    Returns:
+        str: The path of the `.arrow` file.
+    """
+    safe_name = re.sub(r"[^\w.-]", "_", name)
+    return os.path.join(snapshot_dir, f"{safe_name}.arrow")
+
+
+def write_snapshot(df, name, version, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Writes a DataFrame to an uncompressed Arrow IPC file tagged with a data version.
+
+    Args:
+        df (pd.DataFrame): The data to snapshot.
+        name (str): The snapshot name.
+        version (dict): JSON-serializable version of the source data, compared on read.
+        snapshot_dir (str): Directory holding the snapshots. Nothing is written when None.
+    """
+    if not snapshot_dir:
+        return
+    os.makedirs(snapshot_dir, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_VERSION_KEY] = json.dumps(version, default=str).encode()
+    table = table.replace_schema_metadata(metadata)
+    path = snapshot_path(name, snapshot_dir)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(name, version, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Reads a snapshot through a memory map if it exists and matches the expected data version.
+
+    The frame is returned as written, so snapshots must be written already normalized.
+
+    Args:
+        name (str): The snapshot name.
+        version (dict): The current version of the source data.
+        snapshot_dir (str): Directory holding the snapshots.
+
+    Returns:
+        pd.DataFrame or None: The snapshot data, or None if it is missing or stale.
+    """
+    if not snapshot_dir:
+        return None
+    path = snapshot_path(name, snapshot_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+    stored_version = (table.schema.metadata or {}).get(_VERSION_KEY)
+    if stored_version != json.dumps(version, default=str).encode():
+        return None
+    # One block per column lets null-free numeric columns wrap the mapped buffers without a consolidation copy
+    return table.to_pandas(split_blocks=True)
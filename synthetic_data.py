@@ -0,0 +1,164 @@
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import create_engine, text
+
+# Arrow schema of the generated `sales_economics` rows
+SALES_ECONOMICS_SCHEMA = pa.schema([
+    ("variable", pa.string()),
+    ("date", pa.timestamp("ns")),
+    ("value", pa.float64()),
+    ("value01", pa.float64()),
+])
+
+# Periods per year and seasonal cycles (in periods) of the generated series, keyed on the pandas frequency prefix
+FREQUENCY_PROFILES = {
+    "MS": (12, (12,)), "ME": (12, (12,)), "M": (12, (12,)),
+    "QS": (4, (4,)), "QE": (4, (4,)), "Q": (4, (4,)),
+    "W": (52.18, (52.18,)), "D": (365.25, (7, 365.25)), "B": (261, (5, 261)),
+}
+
+
+def variable_names(indices, width=4, prefix="var"):
+    """
+    Returns zero-padded variable names, e.g. `var0000` to `var9999`.
+    """
+    return [f"{prefix}{index:0{width}d}" for index in indices]
+
+
+def _simulate(variable_indices, n_periods, freq, seed):
+    # One row of parameters and noise per variable. Each variable draws from its own seeded
+    # generator, so a series does not depend on which chunk it is generated in.
+    steps = np.arange(n_periods)
+    per_year, periods = FREQUENCY_PROFILES.get(freq.split("-")[0], (1, ()))
+    log_values = np.empty((len(variable_indices), n_periods))
+    for row, index in enumerate(variable_indices):
+        rng = np.random.default_rng([seed, index])
+        level = rng.uniform(np.log(10), np.log(1e6))
+        growth = rng.normal(0.02, 0.04) / per_year
+        volatility = rng.uniform(0.01, 0.1) / np.sqrt(per_year)
+        series = level + growth * steps + np.cumsum(rng.normal(0, volatility, n_periods))
+        for period in periods:
+            amplitude = rng.uniform(0, 0.15)
+            series += amplitude * np.sin(2 * np.pi * (steps / period + rng.uniform()))
+        log_values[row] = series
+    return np.exp(log_values)
+
+
+def generate_sales_economics(n_variables=10, n_periods=None, start="1960-01-01", end=None, freq="MS", seed=0, variable_offset=0, prefix="var", name_width=None):
+    """
+    Generates `sales_economics`-shaped data: positive, trending, seasonal random-walk series.
+
+    Values are log-normal around levels spread over five orders of magnitude, with
+    annual drift, volatility and seasonal amplitude drawn per variable. `value01` is the
+    min-max normalized value of each variable, as in the source table.
+
+    Args:
+        n_variables (int): Number of variables to generate.
+        n_periods (int, optional): Number of dates per variable. Required unless `end` is given.
+        start (str): First date.
+        end (str, optional): Last date, used when `n_periods` is not given.
+        freq (str): Pandas frequency of the dates, e.g. "MS" for monthly or "D" for daily.
+        seed (int): Random seed; a variable's series only depends on the seed and its index.
+        variable_offset (int): Index of the first variable, for generating in chunks.
+        prefix (str): Prefix of the variable names.
+        name_width (int, optional): Digits of the variable names; defaults to fit the last index.
+
+    Returns:
+        pd.DataFrame: Columns `variable`, `date`, `value` and `value01`, sorted by variable and date.
+    """
+    dates = pd.date_range(start, end, periods=n_periods, freq=freq)
+    indices = range(variable_offset, variable_offset + n_variables)
+    names = variable_names(indices, name_width or max(4, len(str(indices[-1]))), prefix)
+    values = _simulate(indices, len(dates), freq, seed)
+    minimum = values.min(axis=1, keepdims=True)
+    spread = values.max(axis=1, keepdims=True) - minimum
+    values01 = (values - minimum) / np.where(spread > 0, spread, 1)
+    return pd.DataFrame({
+        "variable": np.repeat(names, len(dates)),
+        "date": np.tile(dates.to_numpy(), n_variables),
+        "value": values.ravel(),
+        "value01": values01.ravel(),
+    })
+
+
+def iter_sales_economics(n_variables, chunk_variables=100, **kwargs):
+    """
+    Generates the data in chunks of whole variables, to bound memory at large scales.
+
+    Args:
+        n_variables (int): Total number of variables.
+        chunk_variables (int): Number of variables per chunk.
+        **kwargs: The other arguments of `generate_sales_economics`.
+
+    Yields:
+        pd.DataFrame: One chunk of rows.
+    """
+    name_width = max(4, len(str(n_variables - 1)))
+    for offset in range(0, n_variables, chunk_variables):
+        yield generate_sales_economics(
+            min(chunk_variables, n_variables - offset), variable_offset=offset, name_width=name_width, **kwargs
+        )
+
+
+def write_sales_economics(chunks, database_url=None, parquet_path=None, table="sales_economics", chunksize=10000):
+    """
+    Writes generated chunks to a SQL table and/or a Parquet file in one pass.
+
+    The SQL table is replaced and indexed on (variable, date), which is how the loaders query it.
+
+    Args:
+        chunks (iterable): DataFrames, e.g. from `iter_sales_economics`.
+        database_url (str, optional): SQLAlchemy URL, e.g. `sqlite:///sales_economics.db` or a PostgreSQL URL.
+        parquet_path (str, optional): Parquet file to write.
+        table (str): SQL table name.
+        chunksize (int): Rows per SQL insert batch.
+
+    Returns:
+        int: Number of rows written.
+    """
+    engine = create_engine(database_url) if database_url else None
+    writer = pq.ParquetWriter(parquet_path, SALES_ECONOMICS_SCHEMA, compression="zstd") if parquet_path else None
+    rows = 0
+    try:
+        for chunk in chunks:
+            if engine is not None:
+                chunk.to_sql(table, engine, if_exists="replace" if rows == 0 else "append", index=False, chunksize=chunksize)
+            if writer is not None:
+                writer.write_table(pa.Table.from_pandas(chunk, schema=SALES_ECONOMICS_SCHEMA, preserve_index=False))
+            rows += len(chunk)
+        if engine is not None:
+            with engine.begin() as connection:
+                connection.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_variable_date ON {table} (variable, date)"))
+    finally:
+        if writer is not None:
+            writer.close()
+        if engine is not None:
+            engine.dispose()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic sales_economics data for scale testing.")
+    parser.add_argument("--variables", type=int, default=1000)
+    parser.add_argument("--years", type=float, default=40, help="Years of history per variable.")
+    parser.add_argument("--freq", default="MS", help="Pandas frequency of the dates: MS (monthly), D (daily), ...")
+    parser.add_argument("--start", default="1960-01-01")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-variables", type=int, default=100)
+    parser.add_argument("--database-url", help="SQLAlchemy URL to write the sales_economics table to.")
+    parser.add_argument("--parquet", help="Parquet file to write.")
+    args = parser.parse_args()
+    if not args.database_url and not args.parquet:
+        parser.error("give --database-url and/or --parquet")
+
+    end = pd.Timestamp(args.start) + pd.DateOffset(days=int(args.years * 365.25) - 1)
+    started = time.perf_counter()
+    rows = write_sales_economics(
+        iter_sales_economics(args.variables, args.chunk_variables, start=args.start, end=end, freq=args.freq, seed=args.seed),
+        args.database_url, args.parquet
+    )
+    print(f"Wrote {rows:,} rows in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,11 @@
+import os
+import sys
+
+# Settings are read once when `config` is first imported, so they are pinned before any test module
+# imports the app: the in-process forecasting engine, an in-memory database, and no disk caches.
+os.environ["FORECAST_API_CLIENT"] = "local"
+os.environ["DATABASE_URL"] = "sqlite://"
+for name in ("DATA_SNAPSHOT_DIR", "FORECAST_CACHE_DIR", "TIMING_LOG_FILE", "TIMING_PROMETHEUS_FILE"):
+    os.environ[name] = ""
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
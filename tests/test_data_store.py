@@ -0,0 +1,66 @@
+import pandas as pd
+
+from data_store import SeriesStore
+
+
+def _series(start, periods, value=0.0):
+    return pd.DataFrame({
+        "variable": pd.Categorical(["var0000"] * periods),
+        "date": pd.date_range(start, periods=periods, freq="MS"),
+        "value": [value + step for step in range(periods)],
+        "value01": [0.0] * periods,
+    })
+
+
+class OverlappingLoader:
+    """
+    Returns the first `initial` rows on a full load and, after a watermark, rows from `overlap`
+    periods before it, like a backend whose date comparison is inclusive or imprecise.
+    """
+
+    def __init__(self, table, initial, overlap=2):
+        self.table = table
+        self.initial = initial
+        self.overlap = overlap
+        self.calls = []
+
+    def __call__(self, variable, after_date=None):
+        self.calls.append(after_date)
+        if after_date is None:
+            return self.table.iloc[:self.initial].reset_index(drop=True)
+        position = self.table["date"].searchsorted(after_date)
+        return self.table.iloc[max(position - self.overlap, 0):].reset_index(drop=True)
+
+
+def test_refresh_never_appends_rows_at_or_before_the_watermark():
+    table = _series("2020-01-01", 12)
+    store = SeriesStore(loader=OverlappingLoader(table, initial=8))
+    assert len(store.get("var0000")) == 8
+    watermark = store.watermark("var0000")
+
+    assert store.refresh("var0000") == 4
+    df = store.get("var0000")
+    assert len(df) == 12
+    assert df["date"].is_unique and df["date"].is_monotonic_increasing
+    assert (df.loc[8:, "date"] > watermark).all()
+    assert store.watermark("var0000") == table["date"].max()
+    assert isinstance(df["variable"].dtype, pd.CategoricalDtype)
+
+
+def test_refresh_without_new_rows_keeps_the_stored_frame():
+    table = _series("2020-01-01", 6)
+    store = SeriesStore(loader=OverlappingLoader(table, initial=6))
+    df = store.get("var0000")
+
+    assert store.refresh("var0000") == 0
+    assert store.get("var0000") is df
+
+
+def test_refresh_queries_after_the_watermark_and_loads_unknown_variables_in_full():
+    table = _series("2020-01-01", 10)
+    loader = OverlappingLoader(table, initial=10)
+    store = SeriesStore(loader=loader)
+
+    assert store.refresh("var0000") == 10
+    store.refresh("var0000")
+    assert loader.calls == [None, table["date"].max()]
@@ -0,0 +1,79 @@
+import time
+import threading
+
+from forecast_cache import SingleFlight
+
+
+def _wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def _run_concurrently(flight, key, fn, followers):
+    results = [None] * (followers + 1)
+    errors = [None] * (followers + 1)
+
+    def call(index):
+        try:
+            results[index] = flight.do(key, fn)
+        except Exception as error:
+            errors[index] = error
+
+    threads = [threading.Thread(target=call, args=(0,))]
+    threads[0].start()
+    _wait_until(lambda: flight.stats()["in_flight"] == 1)
+    threads += [threading.Thread(target=call, args=(index,)) for index in range(1, followers + 1)]
+    for thread in threads[1:]:
+        thread.start()
+    return threads, results, errors
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "forecast"
+
+    threads, results, _ = _run_concurrently(flight, "key", fn, followers=4)
+    _wait_until(lambda: flight.stats()["coalesced"] == 4)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results[0] == ("forecast", False)
+    assert results[1:] == [("forecast", True)] * 4
+    assert flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_single_flight_shares_errors_and_forgets_the_call():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        raise RuntimeError("backend down")
+
+    threads, _, errors = _run_concurrently(flight, "key", fn, followers=2)
+    _wait_until(lambda: flight.stats()["coalesced"] == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    # A later call for the same key runs again instead of replaying the failure
+    assert flight.do("key", lambda: "recovered") == ("recovered", False)
+
+
+def test_single_flight_does_not_coalesce_different_keys():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("b", lambda: 2) == (2, False)
+    assert flight.stats()["coalesced"] == 0
+
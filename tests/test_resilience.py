@@ -0,0 +1,68 @@
+import time
+import pytest
+import requests
+
+from resilience import CircuitBreaker, CircuitOpenError, call_with_retries
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.stats() == {"state": "open", "failures": 3}
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_success_resets_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.stats() == {"state": "closed", "failures": 1}
+
+
+def test_breaker_half_open_allows_one_trial_and_closes_on_success():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.1)
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    # Only the trial call goes through while it is running
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.stats() == {"state": "closed", "failures": 0}
+    breaker.before_call()
+
+
+def test_breaker_half_open_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0.05)
+    for _ in range(5):
+        breaker.record_failure()
+    time.sleep(0.1)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_call_with_retries_counts_only_transient_errors():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    def fail(error):
+        raise error
+
+    with pytest.raises(ValueError):
+        call_with_retries(lambda: fail(ValueError("bad request")), breaker=breaker, max_attempts=3)
+    assert breaker.stats() == {"state": "closed", "failures": 0}
+
+    with pytest.raises(requests.ConnectionError):
+        call_with_retries(lambda: fail(requests.ConnectionError()), breaker=breaker, max_attempts=2, deadline=5)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        call_with_retries(lambda: "unreachable", breaker=breaker)
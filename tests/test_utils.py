@@ -0,0 +1,79 @@
+import time
+import pandas as pd
+import pytest
+import requests
+
+import utils
+from forecast_cache import ForecastCache
+from resilience import CircuitBreaker
+
+
+class CountingBackend:
+    """
+    Forwards to a forecasting backend, counting calls and optionally failing them.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.calls = []
+        self.failing = False
+
+    def th2forecast_api(self, **kwargs):
+        self.calls.append(kwargs["models_list"])
+        if self.failing:
+            raise requests.ConnectionError("backend down")
+        return self.backend.th2forecast_api(**kwargs)
+
+
+@pytest.fixture
+def actuals():
+    return pd.DataFrame({
+        "date": pd.date_range("2018-01-01", periods=48, freq="MS"),
+        "value": [100.0 + step + 10 * (step % 12 == 0) for step in range(48)],
+    })
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    # A fresh backend, cache and breaker per test, with single attempts so failures surface at once
+    backend = CountingBackend(utils.api)
+    monkeypatch.setattr(utils, "api", backend)
+    monkeypatch.setattr(utils, "forecast_cache", ForecastCache(ttl=0.2))
+    monkeypatch.setattr(utils, "forecast_breaker", CircuitBreaker())
+    monkeypatch.setitem(utils.RESILIENCE_CONFIG, "max_attempts", 1)
+    return backend
+
+
+def test_model_ids_follow_the_requested_order(actuals, backend):
+    forward = utils.get_api_forecasts(actuals, fcast_horizon=6, models_list=["naive", "ets"])
+    reverse = utils.get_api_forecasts(actuals, fcast_horizon=6, models_list=["ets", "naive"])
+
+    # Both orders share one sorted request and cache entry
+    assert backend.calls == [["ets", "naive"]]
+    for model in ("naive", "ets"):
+        expected = utils.api.backend.th2forecast_api(
+            actuals=actuals, fcast_horizon=6, group_target=None, target_var="value", date_var="date", models_list=[model]
+        )
+        expected = utils.decode_forecasts(expected)["value"].to_numpy()
+        forward_values = forward.loc[forward[".model_id"] == ["naive", "ets"].index(model) + 1, "value"].to_numpy()
+        reverse_values = reverse.loc[reverse[".model_id"] == ["ets", "naive"].index(model) + 1, "value"].to_numpy()
+        assert forward_values == pytest.approx(expected)
+        assert reverse_values == pytest.approx(expected)
+
+
+def test_stale_result_is_served_when_the_backend_fails(actuals, backend):
+    fresh = utils.get_api_forecasts(actuals, fcast_horizon=6, models_list=["naive"])
+    assert "stale" not in fresh.attrs
+    time.sleep(0.3)
+    backend.failing = True
+
+    stale = utils.get_api_forecasts(actuals, fcast_horizon=6, models_list=["naive"])
+    assert stale.attrs["stale"] is True
+    pd.testing.assert_frame_equal(stale, fresh)
+    assert len(backend.calls) == 2
+
+
+def test_failure_without_a_cached_result_is_raised(actuals, backend):
+    backend.failing = True
+    with pytest.raises(requests.ConnectionError):
+        utils.get_api_forecasts(actuals, fcast_horizon=6, models_list=["naive"])
@@ -0,0 +1,239 @@
+import os
+import json
+import time
+import uuid
+import bisect
+import logging
+import functools
+import threading
+import contextvars
+from contextlib import contextmanager
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+from config import TIMING_CONFIG
+
+# Upper bounds, in seconds, of the Prometheus histogram buckets of span durations
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Spans are logged as one JSON object per message, see `TIMING_LOG_FILE`
+logger = logging.getLogger("thaink2.timing")
+if TIMING_CONFIG["log_file"]:
+    _handler = logging.FileHandler(TIMING_CONFIG["log_file"])
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_otel_tracer = otel_trace.get_tracer("thaink2") if otel_trace is not None and TIMING_CONFIG["otel"] else None
+
+# The run collecting the spans of the current Streamlit rerun (or benchmark iteration)
+_current_run = contextvars.ContextVar("timing_run", default=None)
+_current_parent = contextvars.ContextVar("timing_parent", default=None)
+
+
+class SpanMetrics:
+    """
+    Process-wide duration histograms per span name, rendered in the Prometheus text format.
+    """
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self._histograms.setdefault(name, {"buckets": [0] * len(self.buckets), "count": 0, "sum": 0.0})
+            index = bisect.bisect_left(self.buckets, seconds)
+            if index < len(self.buckets):
+                histogram["buckets"][index] += 1
+            histogram["count"] += 1
+            histogram["sum"] += seconds
+
+    def prometheus_text(self):
+        """
+        Returns the histograms in the Prometheus text exposition format.
+        """
+        lines = [
+            "# HELP thaink2_span_duration_seconds Duration of instrumented forecast pipeline stages.",
+            "# TYPE thaink2_span_duration_seconds histogram",
+        ]
+        with self._lock:
+            for name, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram["buckets"]):
+                    cumulative += count
+                    lines.append(f'thaink2_span_duration_seconds_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'thaink2_span_duration_seconds_bucket{{span="{name}",le="+Inf"}} {histogram["count"]}')
+                lines.append(f'thaink2_span_duration_seconds_sum{{span="{name}"}} {histogram["sum"]:.6f}')
+                lines.append(f'thaink2_span_duration_seconds_count{{span="{name}"}} {histogram["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """
+        Atomically writes the histograms to a file, e.g. for the node_exporter textfile collector.
+        """
+        text = self.prometheus_text()
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "w") as file:
+            file.write(text)
+        os.replace(temporary, path)
+
+
+span_metrics = SpanMetrics()
+
+
+class TimingRun:
+    """
+    Collects the spans recorded while it is the current run, from any thread.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.run_id = uuid.uuid4().hex[:12]
+        self.spans = []
+        self.started = time.perf_counter()
+        self.duration_ms = None
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        with self._lock:
+            self.spans.append(record)
+
+    def finish(self):
+        """
+        Ends the run and exports the metrics to `TIMING_PROMETHEUS_FILE` when configured.
+
+        Returns:
+            float: The run wall time in milliseconds.
+        """
+        self.duration_ms = (time.perf_counter() - self.started) * 1000
+        if TIMING_CONFIG["prometheus_file"]:
+            span_metrics.write_prometheus(TIMING_CONFIG["prometheus_file"])
+        return self.duration_ms
+
+    def summary(self):
+        """
+        Aggregates the spans per name, in order of first occurrence.
+
+        Nested spans are also counted in their parents, and spans from concurrent threads can
+        overlap, so the shares of the run wall time may add up to more than 100%.
+
+        Returns:
+            list: One dict per span name with `span`, `parent`, `calls`, `total_ms`, `max_ms` and `share`.
+        """
+        total = self.duration_ms or (time.perf_counter() - self.started) * 1000
+        rows = {}
+        with self._lock:
+            spans = sorted(self.spans, key=lambda record: record["offset_ms"])
+        for record in spans:
+            row = rows.setdefault(record["span"], {
+                "span": record["span"], "parent": record["parent"], "calls": 0, "total_ms": 0.0, "max_ms": 0.0
+            })
+            row["calls"] += 1
+            row["total_ms"] += record["duration_ms"]
+            row["max_ms"] = max(row["max_ms"], record["duration_ms"])
+        for row in rows.values():
+            row["share"] = round(row["total_ms"] / total, 4) if total else 0.0
+            row["total_ms"] = round(row["total_ms"], 3)
+        return list(rows.values())
+
+
+def start_run(name="rerun"):
+    """
+    Starts collecting the spans of the current context, e.g. of one Streamlit rerun.
+
+    Args:
+        name (str): Name of the run, included in the log records.
+
+    Returns:
+        TimingRun: The new current run.
+    """
+    run = TimingRun(name)
+    _current_run.set(run)
+    _current_parent.set(None)
+    return run
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Times a block, logs it as a structured record and adds it to the current run.
+
+    Args:
+        name (str): Name of the stage.
+        **attributes: Extra fields of the record; the yielded dict can be updated inside the block.
+
+    Yields:
+        dict: The record's attributes.
+    """
+    if not TIMING_CONFIG["enabled"]:
+        yield attributes
+        return
+    parent_token = _current_parent.set(name)
+    parent = parent_token.old_value if parent_token.old_value is not contextvars.Token.MISSING else None
+    otel_span = _otel_tracer.start_as_current_span(name) if _otel_tracer is not None else None
+    otel_current = otel_span.__enter__() if otel_span is not None else None
+    started = time.perf_counter()
+    error = None
+    try:
+        yield attributes
+    except BaseException as exception:
+        error = type(exception).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        _current_parent.reset(parent_token)
+        run = _current_run.get()
+        record = {
+            "span": name,
+            "parent": parent,
+            "duration_ms": round(duration * 1000, 3),
+            "offset_ms": round((started - run.started) * 1000, 3) if run is not None else None,
+            "run": run.name if run is not None else None,
+            "run_id": run.run_id if run is not None else None,
+            "thread": threading.current_thread().name,
+            **attributes,
+        }
+        if error is not None:
+            record["error"] = error
+        span_metrics.observe(name, duration)
+        if run is not None:
+            run.add(record)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(record, default=str))
+        if otel_span is not None:
+            for key, value in attributes.items():
+                otel_current.set_attribute(key, value if isinstance(value, (str, bool, int, float)) else str(value))
+            otel_span.__exit__(None, None, None)
+
+
+def timed(name=None):
+    """
+    Decorates a function so that every call is recorded as a span.
+
+    Args:
+        name (str, optional): Span name; defaults to the function name.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name or fn.__name__):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def in_current_context(fn):
+    """
+    Binds a function to a copy of the current context, so spans recorded when it runs on a
+    worker thread still reach the caller's run.
+    """
+    return functools.partial(contextvars.copy_context().run, fn)
@@ -1,47 +1,299 @@
 import os
 import sys
-from sqlalchemy import create_engine
-from dotenv import load_dotenv
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import DateTime, bindparam, create_engine, text
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import plotly.graph_objects as go
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from th2analytics_py.th2analytics.forecasting import ForecastingAPI
+from config import (
+    DATA_VALUE_DTYPE, DATABASE_URL, DB_CHUNK_SIZE, DB_CONFIG, DB_POOL_CONFIG, FORECAST_API_CLIENT, FORECAST_MAX_WORKERS,
+    MODEL_LOOKBACK_WINDOWS, RESILIENCE_CONFIG, SNAPSHOT_DIR
+)
+from backends import create_backend
+from metrics import compute_accuracy_metrics
+from forecast_cache import forecast_cache, forecast_single_flight, make_forecast_key
+from resilience import call_with_retries, forecast_breaker
+from snapshot import read_snapshot, write_snapshot
+from timing import in_current_context, span, timed
 
-# Load environment variables from a .env file
-load_dotenv()
+# Columns of the `sales_economics` table that loaders may project
+SALES_ECONOMICS_COLUMNS = ("variable", "date", "value", "value01")
 
-# Database connection parameters loaded from environment variables
-DB_CONFIG = {
-    "host": os.getenv("DB_HOST"),
-    "database": os.getenv("DB_NAME"),
-    "user": os.getenv("DB_USER"),
-    "password": os.getenv("DB_PASSWORD"),
-    "port": os.getenv("DB_PORT"),
-}
+_engine = None
+_engine_lock = threading.Lock()
 
-# Initialize the Forecasting API with the base URL and API token
-api = ForecastingAPI(
-    base_url=os.getenv("API_URL"),
-    api_token=os.getenv("THAINK2_API_TOKEN")
-)
+# Initialize the forecasting backend selected by FORECAST_API_CLIENT (see `backends.BACKENDS`):
+# the Thaink² API through its own client ("sync"), a pooled client with request timeouts ("pooled")
+# or its async variant ("async"), the in-process NumPy engine ("local"), or recorded responses
+# ("record" / "replay").
+api = create_backend(FORECAST_API_CLIENT)
+
+# Models offered for comparison by the configured forecasting backend
+MODEL_OPTIONS = list(getattr(api, "models", ["xgboost", "arima", "random_forest"]))
 
-def load_data_from_data_base():
+
+def get_engine():
     """
-    Connects to a PostgreSQL database and retrieves data from the `sales_economics` table.
+    Returns the process-wide SQLAlchemy engine, creating it on first use.
+
+    The engine lives at module level, so its connection pool is shared by every
+    loader and every Streamlit session and survives script reruns.
+
+    Returns:
+        sqlalchemy.engine.Engine: The pooled engine for the PostgreSQL database, or for `DATABASE_URL` when set.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(
+                    DATABASE_URL or f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}",
+                    **DB_POOL_CONFIG
+                )
+    return _engine
+
+def dispose_engine():
+    """
+    Closes every pooled connection and drops the shared engine, so the next call to `get_engine` builds a new one.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+
+def normalize_sales_economics(df, value_dtype=DATA_VALUE_DTYPE):
+    """
+    Normalizes a loaded `sales_economics` frame to its compact, typed schema.
+
+    `variable` becomes categorical, `date` becomes datetime64, `value`/`value01` use
+    `value_dtype`, and rows are sorted by (variable, date) so that every series is a
+    contiguous, date-ordered block.
+
+    Args:
+        df (pd.DataFrame): Rows as returned by the database driver, with any subset of `SALES_ECONOMICS_COLUMNS`.
+        value_dtype (str): Floating point dtype of the value columns.
+
+    Returns:
+        pd.DataFrame: The normalized DataFrame with a fresh RangeIndex.
+    """
+    df = df.copy()
+    if "variable" in df.columns:
+        df["variable"] = df["variable"].astype("category")
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"])
+    for column in ("value", "value01"):
+        if column in df.columns:
+            df[column] = df[column].astype(value_dtype)
+    sort_columns = [column for column in ("variable", "date") if column in df.columns]
+    if sort_columns:
+        df = df.sort_values(sort_columns, kind="stable", ignore_index=True)
+    return df
+
+def get_data_version(variable=None):
+    """
+    Returns a cheap version stamp of the `sales_economics` data, used to validate local snapshots.
+
+    Besides the row count and date range, the stamp holds the sums of `value` and `value01`, so
+    in-place updates and row replacements that keep the count change it too. On PostgreSQL it
+    also includes the table's insert/update/delete counters from `pg_stat_user_tables`, which
+    change on any write.
+
+    Args:
+        variable (str, optional): Restrict the stamp to one variable. Defaults to None.
 
     Returns:
-        pd.DataFrame: A DataFrame containing the data from the `sales_economics` table.
+        dict: The version stamp of the (filtered) table.
     """
-    engine = create_engine(
-        f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
+    query = (
+        "SELECT COUNT(*) AS row_count, MIN(date) AS min_date, MAX(date) AS max_date, "
+        "SUM(value) AS value_sum, SUM(value01) AS value01_sum FROM sales_economics"
     )
+    params = {}
+    if variable is not None:
+        query += " WHERE variable = :variable"
+        params["variable"] = variable
+    engine = get_engine()
+    with engine.connect() as connection:
+        row = connection.execute(text(query + ";"), params).one()
+        writes = None
+        if engine.dialect.name == "postgresql":
+            writes = connection.execute(text(
+                "SELECT n_tup_ins + n_tup_upd + n_tup_del FROM pg_stat_user_tables WHERE relname = 'sales_economics';"
+            )).scalar()
+    # Sums are rounded so that a different float summation order does not invalidate the snapshot
+    return {
+        "rows": int(row.row_count),
+        "min_date": str(row.min_date),
+        "max_date": str(row.max_date),
+        "value_sum": f"{float(row.value_sum or 0):.12g}",
+        "value01_sum": f"{float(row.value01_sum or 0):.12g}",
+        "writes": None if writes is None else int(writes),
+        "value_dtype": DATA_VALUE_DTYPE,
+    }
+
+def load_data_from_data_base(use_snapshot=True):
+    """
+    Connects to a PostgreSQL database and retrieves data from the `sales_economics` table.
+
+    Args:
+        use_snapshot (bool): Whether to read from, and refresh, the local Arrow snapshot when
+            `DATA_SNAPSHOT_DIR` is configured. Defaults to True.
+
+    Returns:
+        pd.DataFrame: A DataFrame containing the data from the `sales_economics` table, normalized
+        with `normalize_sales_economics`.
+    """
+    use_snapshot = use_snapshot and SNAPSHOT_DIR is not None
+    if use_snapshot:
+        version = get_data_version()
+        # Snapshots are written normalized, so they are returned without another copy
+        df = read_snapshot("sales_economics", version)
+        if df is not None:
+            return df
     query = "SELECT * FROM sales_economics;"
-    df = pd.read_sql_query(query, engine)
+    df = normalize_sales_economics(pd.read_sql_query(query, get_engine()))
+    if use_snapshot:
+        write_snapshot(df, "sales_economics", version)
     return df
 
-def get_api_forecasts(actuals, fcast_horizon=30, group_target=None, target_var="value", date_var="date", models_list=["xgboost"], save_as_df=True):
+def load_variable_from_data_base(variable, start_date=None, end_date=None, columns=SALES_ECONOMICS_COLUMNS, after_date=None, use_snapshot=True):
+    """
+    Retrieves a single series from the `sales_economics` table, filtering and projecting in SQL.
+
+    Args:
+        variable (str): The variable to load.
+        start_date (str or datetime, optional): Earliest date to include. Defaults to None.
+        end_date (str or datetime, optional): Latest date to include. Defaults to None.
+        columns (list): Columns to select, a subset of `SALES_ECONOMICS_COLUMNS`.
+        after_date (str or datetime, optional): Only include rows strictly newer than this date. Defaults to None.
+        use_snapshot (bool): Whether to read from, and refresh, the local Arrow snapshot of the full
+            series when `DATA_SNAPSHOT_DIR` is configured. Only used without date filters. Defaults to True.
+
+    Returns:
+        pd.DataFrame: The rows of the requested variable, ordered by date and normalized with `normalize_sales_economics`.
+    """
+    unknown = set(columns) - set(SALES_ECONOMICS_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown sales_economics columns: {sorted(unknown)}")
+    query = f"SELECT {', '.join(columns)} FROM sales_economics WHERE variable = :variable"
+    params = {"variable": variable}
+    if start_date is not None:
+        query += " AND date >= :start_date"
+        params["start_date"] = pd.Timestamp(start_date).to_pydatetime()
+    if end_date is not None:
+        query += " AND date <= :end_date"
+        params["end_date"] = pd.Timestamp(end_date).to_pydatetime()
+    if after_date is not None:
+        query += " AND date > :after_date"
+        params["after_date"] = pd.Timestamp(after_date).to_pydatetime()
+    query += " ORDER BY date;"
+    # Typed date parameters are rendered in the stored datetime format by drivers without a native type (SQLite)
+    query = text(query).bindparams(*(bindparam(name, type_=DateTime) for name in params if name != "variable"))
+    use_snapshot = use_snapshot and SNAPSHOT_DIR is not None and len(params) == 1
+    if use_snapshot:
+        snapshot_name = f"sales_economics-{variable}-{'-'.join(columns)}"
+        version = get_data_version(variable)
+        df = read_snapshot(snapshot_name, version)
+        if df is not None:
+            return df
+    df = normalize_sales_economics(pd.read_sql_query(query, get_engine(), params=params))
+    if use_snapshot:
+        write_snapshot(df, snapshot_name, version)
+    return df
+
+def iter_data_from_data_base(chunksize=DB_CHUNK_SIZE, columns=SALES_ECONOMICS_COLUMNS, as_arrow=False):
+    """
+    Streams the `sales_economics` table in chunks through a server-side cursor.
+
+    Only one chunk is held in memory at a time, so peak memory is bounded by `chunksize`
+    rather than by the size of the table.
+
+    Args:
+        chunksize (int): Number of rows per chunk.
+        columns (list): Columns to select, a subset of `SALES_ECONOMICS_COLUMNS`.
+        as_arrow (bool): Whether to yield `pyarrow.RecordBatch` objects instead of DataFrames. Defaults to False.
+
+    Yields:
+        pd.DataFrame or pyarrow.RecordBatch: Chunks of rows typed like `normalize_sales_economics`
+        (each chunk with its own categories), ordered by variable and date.
+    """
+    unknown = set(columns) - set(SALES_ECONOMICS_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown sales_economics columns: {sorted(unknown)}")
+    query = f"SELECT {', '.join(columns)} FROM sales_economics ORDER BY variable, date;"
+    # Chunks get the schema of `normalize_sales_economics`, without its copy and re-sort (the query orders rows)
+    dtype = {column: DATA_VALUE_DTYPE for column in ("value", "value01") if column in columns}
+    if "variable" in columns:
+        dtype["variable"] = "category"
+    parse_dates = ["date"] if "date" in columns else None
+    with get_engine().connect().execution_options(stream_results=True, max_row_buffer=chunksize) as connection:
+        for chunk in pd.read_sql_query(text(query), connection, chunksize=chunksize, dtype=dtype, parse_dates=parse_dates):
+            yield pa.RecordBatch.from_pandas(chunk, preserve_index=False) if as_arrow else chunk
+
+def load_partitioned_data_from_data_base(chunksize=DB_CHUNK_SIZE, columns=SALES_ECONOMICS_COLUMNS):
+    """
+    Streams the `sales_economics` table and builds one DataFrame per variable as chunks arrive.
+
+    Args:
+        chunksize (int): Number of rows per chunk.
+        columns (list): Columns to select; must include `variable`.
+
+    Returns:
+        dict: A dictionary where keys are variables and values are DataFrames of their rows, ordered by date.
+    """
+    if "variable" not in columns:
+        raise ValueError("Partitioned loading requires the 'variable' column.")
+    pieces = {}
+    for chunk in iter_data_from_data_base(chunksize=chunksize, columns=columns):
+        for variable, piece in chunk.groupby("variable", sort=False, observed=True):
+            pieces.setdefault(variable, []).append(piece)
+    return {
+        variable: normalize_sales_economics(pd.concat(variable_pieces, ignore_index=True))
+        for variable, variable_pieces in pieces.items()
+    }
+
+def get_lookback_window(models_list):
+    """
+    Returns the trailing history window needed by a set of models.
+
+    Args:
+        models_list (list): A list of forecasting models.
+
+    Returns:
+        int or None: The largest configured window, or None if any model needs the full history.
+    """
+    windows = [MODEL_LOOKBACK_WINDOWS.get(model) for model in models_list]
+    if not windows or None in windows:
+        return None
+    return max(windows)
+
+def trim_actuals(actuals, date_var="date", target_var="value", group_target=None, lookback=None):
+    """
+    Reduces a forecast request to the columns and history the backend needs.
+
+    Args:
+        actuals (pd.DataFrame): Historical data used as input for forecasting, ordered by date.
+        date_var (str): The date variable in the input data.
+        target_var (str): The target variable for forecasting.
+        group_target (str, optional): Grouping variable, if applicable. Defaults to None.
+        lookback (int, optional): Number of trailing rows to keep per series. Defaults to None, which keeps all.
+
+    Returns:
+        pd.DataFrame: The date, target and group columns of the trailing window.
+    """
+    columns = [date_var, target_var] + ([group_target] if group_target else [])
+    actuals = actuals[columns]
+    if lookback is not None:
+        actuals = actuals.groupby(group_target, sort=False, observed=True).tail(lookback) if group_target else actuals.tail(lookback)
+    return actuals
+
+def get_api_forecasts(actuals, fcast_horizon=30, group_target=None, target_var="value", date_var="date", models_list=["xgboost"], save_as_df=True, use_cache=True, lookback="models"):
     """
     Fetches forecasts from the Forecasting API.
 
@@ -53,24 +305,135 @@ def get_api_forecasts(actuals, fcast_horizon=30, group_target=None, target_var="
         date_var (str): The date variable in the input data.
         models_list (list): A list of forecasting models to use.
         save_as_df (bool): Whether to return the result as a DataFrame. Defaults to True.
+        use_cache (bool): Whether to serve identical requests from the forecast cache. Defaults to True.
+        lookback (int, str or None): Trailing rows per series to send. "models" (default) uses the
+            largest `MODEL_LOOKBACK_WINDOWS` entry of the selected models; None sends the full history.
+
+    Only the date, target and group columns are sent, see `trim_actuals`.
+
+    Calls are retried with jittered backoff within a deadline and fail fast while the circuit
+    breaker is open. If they still fail, the last cached result is returned, flagged with
+    `result.attrs["stale"] = True`.
+
+    Every call is timed as a `get_api_forecasts` span recording whether the cache was hit.
 
     Returns:
         pd.DataFrame: A DataFrame containing the forecasted values.
     """
-    forecasts = api.th2forecast_api(
-        actuals=actuals,
-        fcast_horizon=fcast_horizon,
-        group_target=group_target,
-        target_var=target_var,
-        date_var=date_var,
-        models_list=models_list
-    )
-    result = pd.json_normalize(forecasts)
-    result = result.rename(columns={'.index': 'date', '.value': target_var})
-    result['date'] = pd.to_datetime(result['date'])
+    with span("get_api_forecasts", horizon=fcast_horizon, models=",".join(models_list), group_target=group_target) as attributes:
+        # Models are always requested in sorted order, so requests that only differ in model order
+        # share a cache entry; `.model_id` is then mapped back to the position in `models_list`.
+        sorted_models = sorted(models_list)
+        if lookback == "models":
+            lookback = get_lookback_window(sorted_models)
+        actuals = trim_actuals(actuals, date_var, target_var, group_target, lookback)
+        cache_key = make_forecast_key(actuals, fcast_horizon, group_target, target_var, date_var, sorted_models)
+        result = forecast_cache.get(cache_key) if use_cache else None
+        attributes.update(rows=len(actuals), cache="hit" if result is not None else "miss")
+        if result is None:
+            # Identical requests already in flight from other sessions are awaited instead of re-sent;
+            # every caller gets its own copy of the shared result.
+            try:
+                result, _ = forecast_single_flight.do(
+                    cache_key,
+                    lambda: _request_forecasts(actuals, fcast_horizon, group_target, target_var, date_var, sorted_models, cache_key if use_cache else None)
+                )
+                result = result.copy()
+            except Exception:
+                # Fall back to the last known result when the backend is failing
+                result = forecast_cache.get_stale(cache_key) if use_cache else None
+                if result is None:
+                    raise
+                result.attrs["stale"] = True
+                attributes["cache"] = "stale"
+        if sorted_models != list(models_list):
+            model_ids = {sorted_models.index(model) + 1: index + 1 for index, model in enumerate(models_list)}
+            result['.model_id'] = result['.model_id'].map(model_ids)
+        return result
+
+def _request_forecasts(actuals, fcast_horizon, group_target, target_var, date_var, models_list, cache_key=None):
+    with span("forecast_api_call"):
+        forecasts = call_with_retries(
+            lambda: api.th2forecast_api(
+                actuals=actuals,
+                fcast_horizon=fcast_horizon,
+                group_target=group_target,
+                target_var=target_var,
+                date_var=date_var,
+                models_list=models_list
+            ),
+            breaker=forecast_breaker,
+            **RESILIENCE_CONFIG
+        )
+    result = decode_forecasts(forecasts, target_var)
+    if cache_key is not None:
+        forecast_cache.set(cache_key, result)
     return result
 
-def combine_backtest_forecast(filtered_data, backtest_data, fcast_horizon, target_var, models):
+@timed()
+def decode_forecasts(forecasts, target_var="value"):
+    """
+    Decodes a Forecasting API response into a typed DataFrame in a single pass per column.
+
+    Columns are filled straight from the response records into preallocated NumPy arrays and
+    dates are parsed once as ISO 8601, without the intermediate frames of `pd.json_normalize`.
+
+    Args:
+        forecasts (list): The response records, each with `.model_id`, `.index` and `.value` keys.
+        target_var (str): Name given to the `.value` column.
+
+    Returns:
+        pd.DataFrame: The forecasts, with `.index` renamed to `date` and `.value` to `target_var`.
+    """
+    forecasts = forecasts or []
+    count = len(forecasts)
+    keys = list(forecasts[0]) if count else [".model_id", ".index", ".value"]
+    columns = {}
+    for key in keys:
+        if key == ".model_id":
+            columns[key] = np.fromiter((record[key] for record in forecasts), dtype=np.int64, count=count)
+        elif key == ".value":
+            values = np.fromiter((record[key] for record in forecasts), dtype=object, count=count)
+            columns[target_var] = values.astype(np.float64) if count else np.empty(0, dtype=np.float64)
+        elif key == ".index":
+            dates = np.fromiter((record[key] for record in forecasts), dtype=object, count=count)
+            columns["date"] = pd.to_datetime(dates, format="ISO8601") if count else np.empty(0, dtype="datetime64[ns]")
+        else:
+            columns[key] = np.fromiter((record.get(key) for record in forecasts), dtype=object, count=count)
+    return pd.DataFrame(columns, copy=False)
+
+def concat_forecasts(frames):
+    """
+    Concatenates forecast DataFrames, keeping the stale-fallback flag if any part carries it.
+
+    Args:
+        frames (list): The forecast DataFrames to concatenate.
+
+    Returns:
+        pd.DataFrame: The concatenated forecasts.
+    """
+    result = pd.concat(frames)
+    result.attrs["stale"] = any(frame.attrs.get("stale", False) for frame in frames)
+    return result
+
+def run_forecast_requests(requests_kwargs, max_workers=FORECAST_MAX_WORKERS):
+    """
+    Sends several forecast requests to the Forecasting API concurrently.
+
+    Args:
+        requests_kwargs (list): A list of keyword-argument dicts, one per `get_api_forecasts` call.
+        max_workers (int): Maximum number of requests in flight at the same time.
+
+    Returns:
+        list: The forecast DataFrames, in the same order as `requests_kwargs`.
+    """
+    if len(requests_kwargs) <= 1 or max_workers <= 1:
+        return [get_api_forecasts(**kwargs) for kwargs in requests_kwargs]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests_kwargs))) as executor:
+        futures = [executor.submit(in_current_context(get_api_forecasts), **kwargs) for kwargs in requests_kwargs]
+        return [future.result() for future in futures]
+
+def combine_backtest_forecast(filtered_data, backtest_data, fcast_horizon, target_var, models, concurrent=False):
     """
     Combines backtest and forecast data into a single DataFrame.
 
@@ -80,13 +443,206 @@ def combine_backtest_forecast(filtered_data, backtest_data, fcast_horizon, targe
         fcast_horizon (int): The forecast horizon.
         target_var (str): The target variable for forecasting.
         models (list): List of models to use for forecasting.
+        concurrent (bool): Whether to send the backtest and forecast requests at the same time. Defaults to False.
 
     Returns:
         pd.DataFrame: A combined DataFrame of backtest and forecast data.
     """
+    if concurrent:
+        return combine_backtest_forecasts(filtered_data, backtest_data, fcast_horizon, [target_var], models)[target_var]
     backtest_df = get_api_forecasts(actuals=backtest_data, fcast_horizon=fcast_horizon, target_var=target_var, date_var="date", models_list=models)
     forecast_df = get_api_forecasts(actuals=filtered_data, fcast_horizon=fcast_horizon, target_var=target_var, date_var="date", models_list=models)
-    return pd.concat([backtest_df, forecast_df])
+    return concat_forecasts([backtest_df, forecast_df])
+
+def combine_backtest_forecasts(filtered_data, backtest_data, fcast_horizon, target_vars, models, max_workers=FORECAST_MAX_WORKERS):
+    """
+    Combines backtest and forecast data for several target variables, sending every request concurrently.
+
+    Args:
+        filtered_data (pd.DataFrame): Filtered historical data.
+        backtest_data (pd.DataFrame): Data for backtesting.
+        fcast_horizon (int): The forecast horizon.
+        target_vars (list): The target variables for forecasting.
+        models (list): List of models to use for forecasting.
+        max_workers (int): Maximum number of requests in flight at the same time.
+
+    Returns:
+        dict: A dictionary where keys are target variables and values are combined DataFrames of backtest and forecast data.
+    """
+    requests_kwargs = []
+    for target_var in target_vars:
+        for actuals in (backtest_data, filtered_data):
+            requests_kwargs.append(dict(actuals=actuals, fcast_horizon=fcast_horizon, target_var=target_var, date_var="date", models_list=models))
+    results = run_forecast_requests(requests_kwargs, max_workers=max_workers)
+    return {
+        target_var: concat_forecasts(results[2 * index:2 * index + 2])
+        for index, target_var in enumerate(target_vars)
+    }
+
+def get_batch_forecasts(series, fcast_horizon=30, target_var="value", date_var="date", models_list=["xgboost"], group_var="variable"):
+    """
+    Forecasts several series with a single grouped request to the Forecasting API.
+
+    Args:
+        series (dict): A dictionary where keys are variables and values are DataFrames of their history.
+        fcast_horizon (int): The number of time points to forecast.
+        target_var (str): The target variable for forecasting.
+        date_var (str): The date variable in the input data.
+        models_list (list): A list of forecasting models to use.
+        group_var (str): Name of the column identifying each series in the request and response.
+
+    Returns:
+        dict: A dictionary where keys are variables and values are DataFrames of their forecasts.
+    """
+    actuals = pd.concat(
+        [df[[date_var, target_var]].assign(**{group_var: variable}) for variable, df in series.items()],
+        ignore_index=True
+    )
+    result = get_api_forecasts(
+        actuals=actuals, fcast_horizon=fcast_horizon, group_target=group_var,
+        target_var=target_var, date_var=date_var, models_list=models_list
+    )
+    if group_var not in result.columns:
+        raise ValueError(f"Grouped forecast response has no '{group_var}' column.")
+    return {
+        variable: result[result[group_var] == variable].drop(columns=group_var).reset_index(drop=True)
+        for variable in series
+    }
+
+def combine_backtest_forecast_batch(series, fcast_horizon, target_var, models, group_var="variable"):
+    """
+    Combines backtest and forecast data for several series using two concurrent grouped requests.
+
+    Args:
+        series (dict): A dictionary where keys are variables and values are DataFrames of their history.
+        fcast_horizon (int): The forecast horizon; each backtest holds out the last `fcast_horizon` rows.
+        target_var (str): The target variable for forecasting.
+        models (list): List of models to use for forecasting.
+        group_var (str): Name of the column identifying each series in the request and response.
+
+    Returns:
+        dict: A dictionary where keys are variables and values are combined DataFrames of backtest and forecast data.
+    """
+    backtest_series = {variable: df.iloc[:-fcast_horizon] for variable, df in series.items()}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backtest_future = executor.submit(in_current_context(get_batch_forecasts), backtest_series, fcast_horizon, target_var, "date", models, group_var)
+        forecast_future = executor.submit(in_current_context(get_batch_forecasts), series, fcast_horizon, target_var, "date", models, group_var)
+        backtests, forecasts = backtest_future.result(), forecast_future.result()
+    return {
+        variable: concat_forecasts([backtests[variable], forecasts[variable]])
+        for variable in series
+    }
+
+def scale_forecasts_min_max(forecast_df, actuals, source_var="value", target_var="value01"):
+    """
+    Derives 0-1 scaled forecasts from original-value forecasts using the min/max of the actuals.
+
+    Args:
+        forecast_df (pd.DataFrame): Forecasts of `source_var`.
+        actuals (pd.DataFrame): Historical data the scaling bounds are taken from.
+        source_var (str): The original-value column.
+        target_var (str): The scaled column to add.
+
+    Returns:
+        pd.DataFrame: A copy of `forecast_df` with the added `target_var` column.
+    """
+    min_value, max_value = actuals[source_var].min(), actuals[source_var].max()
+    scaled_df = forecast_df.copy()
+    scaled_df[target_var] = (scaled_df[source_var] - min_value) / (max_value - min_value)
+    return scaled_df
+
+def combine_original_normalized_forecasts(filtered_data, backtest_data, fcast_horizon, models, strict=False):
+    """
+    Combines backtest and forecast data for the original (`value`) and normalized (`value01`) series.
+
+    By default only `value` is sent to the API and the normalized forecasts are derived by min-max
+    scaling them locally, which is exact for scale-invariant models. Strict mode also sends `value01`.
+
+    Args:
+        filtered_data (pd.DataFrame): Filtered historical data.
+        backtest_data (pd.DataFrame): Data for backtesting.
+        fcast_horizon (int): The forecast horizon.
+        models (list): List of models to use for forecasting.
+        strict (bool): Whether to request `value01` forecasts from the API instead of deriving them. Defaults to False.
+
+    Returns:
+        tuple: The combined DataFrames for original and normalized values.
+    """
+    if strict:
+        combined = combine_backtest_forecasts(filtered_data, backtest_data, fcast_horizon, ["value", "value01"], models)
+        return combined["value"], combined["value01"]
+    forecast_original_df = combine_backtest_forecast(filtered_data, backtest_data, fcast_horizon, "value", models, concurrent=True)
+    forecast_normalized_df = scale_forecasts_min_max(forecast_original_df, filtered_data).drop(columns="value")
+    return forecast_original_df, forecast_normalized_df
+
+def rolling_origin_backtest(filtered_data, fcast_horizon, target_var, models, n_folds=3, step=None, window=None, folds_per_request=None, max_workers=FORECAST_MAX_WORKERS):
+    """
+    Backtests models over several forecast origins (cutoffs) with as few API calls as possible.
+
+    Fold 1 holds out the last `fcast_horizon` rows, like the single backtest; each further fold
+    moves the cutoff `step` rows back. Folds are sent as groups of one grouped request, or of
+    several requests of `folds_per_request` folds sent concurrently.
+
+    Args:
+        filtered_data (pd.DataFrame): Filtered historical data, ordered by date.
+        fcast_horizon (int): The forecast horizon.
+        target_var (str): The target variable for forecasting.
+        models (list): List of models to use for forecasting.
+        n_folds (int): Number of cutoffs to evaluate.
+        step (int, optional): Rows between consecutive cutoffs. Defaults to `fcast_horizon`.
+        window (int, optional): Training rows per fold (rolling window). Defaults to None, an expanding window.
+        folds_per_request (int, optional): Maximum folds per API call. Defaults to None, all folds in one call.
+        max_workers (int): Maximum number of requests in flight at the same time.
+
+    Returns:
+        pd.DataFrame: The backtest forecasts of every fold, with `fold`, `cutoff` and the matching `actual` value.
+    """
+    step = step or fcast_horizon
+    folds, cutoffs = {}, {}
+    for index in range(n_folds):
+        end = len(filtered_data) - fcast_horizon - index * step
+        if end <= 0:
+            break
+        label = f"fold{index + 1}"
+        folds[label] = filtered_data.iloc[0 if window is None else max(end - window, 0):end]
+        cutoffs[label] = filtered_data['date'].iloc[end - 1]
+    if not folds:
+        raise ValueError("Not enough history for a single backtest fold.")
+    labels = list(folds)
+    size = folds_per_request or len(labels)
+    chunks = [labels[start:start + size] for start in range(0, len(labels), size)]
+    with ThreadPoolExecutor(max_workers=max(min(max_workers, len(chunks)), 1)) as executor:
+        futures = [
+            executor.submit(in_current_context(get_batch_forecasts), {label: folds[label] for label in chunk}, fcast_horizon, target_var, "date", models, "fold")
+            for chunk in chunks
+        ]
+        fold_forecasts = {}
+        for future in futures:
+            fold_forecasts.update(future.result())
+    backtests = pd.concat(
+        [df.assign(fold=label, cutoff=cutoffs[label]) for label, df in fold_forecasts.items()],
+        ignore_index=True
+    )
+    actuals = filtered_data[['date', target_var]].rename(columns={target_var: 'actual'})
+    return backtests.merge(actuals, on='date', how='inner')
+
+def summarize_backtest_errors(backtests, target_var, model_dict):
+    """
+    Aggregates rolling-origin backtest errors per model across folds.
+
+    Args:
+        backtests (pd.DataFrame): The output of `rolling_origin_backtest`.
+        target_var (str): The target variable that was forecast.
+        model_dict (dict): Dictionary mapping model IDs to model names.
+
+    Returns:
+        pd.DataFrame: One row per model with its fold count and the metrics of `compute_accuracy_metrics`, sorted by RMSE.
+    """
+    aligned = backtests.assign(model=backtests['.model_id'].map(model_dict)).rename(columns={target_var: 'forecast'})
+    summary = compute_accuracy_metrics(aligned, by="model")
+    folds = aligned.groupby('model')['fold'].nunique()
+    summary.insert(1, 'folds', summary['model'].map(folds))
+    return summary
 
 def generate_model_dict(selected_models):
     """
@@ -100,6 +656,7 @@ def generate_model_dict(selected_models):
     """
     return {index + 1: model for index, model in enumerate(selected_models)}
 
+@timed()
 def split_forecasts_by_model(forecast_df, model_dict):
     """
     Splits forecast data by model using a model dictionary.
@@ -116,6 +673,7 @@ def split_forecasts_by_model(forecast_df, model_dict):
         for model_id in model_dict
     }
 
+@timed()
 def create_line_plot(filtered_data, forecasts, title, yaxis_title, zoom_range):
     """
     Creates a line plot for visualizing actuals and forecast data.
@@ -158,6 +716,7 @@ def create_line_plot(filtered_data, forecasts, title, yaxis_title, zoom_range):
     )
     return fig
 
+@timed()
 def create_bar_chart(filtered_data, forecasts, title, yaxis_title, zoom_range):
     """
     Creates a bar chart for visualizing actuals and forecast data.